@@ -33,6 +33,9 @@ SLOT_LABELS = {
     "lute": "鲁特琴",
 }
 
+# 远程武器槽位 (可设置攻击距离)
+RANGED_WEAPON_SLOTS = frozenset({"bow", "crossbow"})
+
 # 武器材料标签
 WEAPON_MATERIAL_LABELS = {"wood": "木", "metal": "金属", "leather": "皮"}
 
@@ -49,6 +52,9 @@ TAG_LABELS = {
     "special exc": "特殊（新英雄）",
 }
 
+# 稀有度自动设为 Unique 的标签
+UNIQUE_RARITY_TAGS = frozenset({"unique", "special", "special exc"})
+
 # 武器槽位平衡值
 SLOT_BALANCE = {
     "twohandedaxe": 0,
@@ -66,7 +72,7 @@ SLOT_BALANCE = {
 }
 
 # 支持左手持握的槽位 (单手武器)
-LEFT_HAND_SLOTS = ["dagger", "mace", "sword", "axe"]
+LEFT_HAND_SLOTS = frozenset({"dagger", "mace", "sword", "axe"})
 
 # ============== 护甲/装备相关枚举 ==============
 
@@ -130,7 +136,9 @@ ARMOR_MATERIAL_LABELS = {
 }
 
 # 需要角色贴图预览的槽位
-ARMOR_SLOTS_WITH_CHAR_PREVIEW = ["shield", "Head", "Chest", "Arms", "Legs", "Back"]
+ARMOR_SLOTS_WITH_CHAR_PREVIEW = frozenset(
+    {"shield", "Head", "Chest", "Arms", "Legs", "Back"}
+)
 
 # 需要多姿势穿戴贴图的装备槽位 (头/身/手/腿/背)
 # 游戏姿势系统：
@@ -138,7 +146,10 @@ ARMOR_SLOTS_WITH_CHAR_PREVIEW = ["shield", "Head", "Chest", "Arms", "Legs", "Bac
 # - 站立姿势1: 其他双手武器 → s_char_{id}_1.png (帧序列第1帧，可选)
 # - 休息姿势: 休息状态 → s_char3_{id}.png (独立贴图槽)
 # 注：游戏用 s_char 帧序列的两帧存储站立姿势，导致这些装备无法支持动画
-ARMOR_SLOTS_MULTI_POSE = ["Head", "Chest", "Arms", "Legs", "Back"]
+ARMOR_SLOTS_MULTI_POSE = frozenset({"Head", "Chest", "Arms", "Legs", "Back"})
+
+# 不允许拆解材料的护甲槽位 (项链、戒指、盾牌)
+ARMOR_NO_FRAGMENT_SLOTS = frozenset({"Ring", "Amulet", "shield"})
 
 # ============== 渲染与动画常量 ==============
 
@@ -171,6 +182,13 @@ VALID_MAX_Y = CHAR_CENTER_Y + VALID_AREA_SIZE // 2  # 52
 VIEWPORT_CHAR_OFFSET_X = VALID_AREA_SIZE // 2 - CHAR_CENTER_X  # = 8
 VIEWPORT_CHAR_OFFSET_Y = VALID_AREA_SIZE // 2 - CHAR_CENTER_Y  # = 12
 
+# 棋盘格背景最小格子边长 (px)，更小时改为纯色填充
+CHECKERBOARD_MIN_CELL_SIZE = 2
+
+# 空闲时阻塞等待输入的超时 (秒) 及输入后继续刷新的帧数
+IDLE_WAIT_TIMEOUT = 0.5
+IDLE_SETTLE_FRAMES = 3
+
 # Byte类型的属性 (需要限制为 0-255)
 BYTE_ATTRIBUTES = {
     "Bleeding_Chance",
@@ -230,6 +248,14 @@ HYBRID_WEIGHT_LABELS = {
     "Heavy": "重",
 }
 
+# 混合物品重量到护甲类别的映射
+HYBRID_WEIGHT_TO_ARMOR_CLASS = {
+    "Light": "Light",
+    "Medium": "Medium",
+    "Heavy": "Heavy",
+    "VeryLight": "Light",
+}
+
 # ============== 统一属性分组映射 ==============
 # 每个属性只有一个分组归属（单一来源）
 # 基于游戏逻辑：
@@ -742,6 +768,9 @@ LANGUAGE_LABELS = {
     "한국어": "한국어",
 }
 
+# 主语言显示标签
+PRIMARY_LANGUAGE_LABEL = LANGUAGE_LABELS.get(PRIMARY_LANGUAGE, PRIMARY_LANGUAGE)
+
 # 语言名称到 C# 枚举的映射
 LANGUAGE_TO_ENUM_MAP = {
     "Chinese": "ModLanguage.Chinese",
@@ -790,6 +819,16 @@ HYBRID_QUALITY_LABELS = {
     7: "文物",
 }
 
+# 混合物品等级标签（0 表示全部等级）
+HYBRID_TIER_LABELS = {
+    0: "全",
+    1: "1",
+    2: "2",
+    3: "3",
+    4: "4",
+    5: "5",
+}
+
 # 触发效果模式（UI 标签映射）
 TRIGGER_MODES = {
     "none": "无",
@@ -817,6 +856,14 @@ HYBRID_WEAPON_TYPES = {
     "lute": "鲁特琴",
 }
 
+# 武器类型选项（下拉框用，导入时计算一次）
+HYBRID_WEAPON_TYPE_OPTIONS = tuple(HYBRID_WEAPON_TYPES)
+
+# 双手武器类型
+HYBRID_TWO_HAND_WEAPON_TYPES = frozenset(
+    {"2hsword", "2haxe", "2hmace", "2hStaff", "bow", "crossbow", "spear"}
+)
+
 # 混合物品伤害类型
 HYBRID_DAMAGE_TYPES = {
     "Slashing_Damage": "劈砍",
@@ -863,6 +910,9 @@ HYBRID_ARMOR_TYPES = {
     "shield": "盾牌",
 }
 
+# 护甲类型选项（下拉框用，导入时计算一次）
+HYBRID_ARMOR_TYPE_OPTIONS = tuple(HYBRID_ARMOR_TYPES)
+
 # 混合物品护甲类别
 HYBRID_ARMOR_CLASSES = {
     "Light": "轻甲",
@@ -30,6 +30,8 @@ ITEM_SUBCATEGORIES = [
 ]
 
 ALL_SUBCATEGORY_OPTIONS = sorted(set(ITEM_CATEGORIES + ITEM_SUBCATEGORIES))
+# 非文物可选的子分类（treasure 仅限文物）
+NON_TREASURE_SUBCATEGORY_OPTIONS = [s for s in ALL_SUBCATEGORY_OPTIONS if s != "treasure"]
 
 # 分类中文翻译 (来自 items.json["consum_type_hover"])
 CATEGORY_TRANSLATIONS: Dict[str, str] = {
@@ -86,6 +88,18 @@ CATEGORY_TRANSLATIONS: Dict[str, str] = {
     "jewelry": "首饰",
 }
 
+# 主分类下拉框标签（"" 表示未选择）
+CATEGORY_COMBO_LABELS: Dict[str, str] = {"": "—"}
+CATEGORY_COMBO_LABELS.update({c: CATEGORY_TRANSLATIONS.get(c, c) for c in ITEM_CATEGORIES})
+
+# 子分类弹窗复选框 (子分类, imgui 标签)，文物与非文物各一份
+SUBCAT_CHECKBOX_LABELS = tuple(
+    (s, f"{CATEGORY_TRANSLATIONS.get(s, s)}##subcat_{s}") for s in ALL_SUBCATEGORY_OPTIONS
+)
+NON_TREASURE_SUBCAT_CHECKBOX_LABELS = tuple(
+    (s, label) for s, label in SUBCAT_CHECKBOX_LABELS if s != "treasure"
+)
+
 
 # ============== Tags 常量（值: 中文标签）==============
 
@@ -128,6 +142,13 @@ EXTRA_TAGS: Dict[str, str] = {
 
 ALL_TAGS = {**QUALITY_TAGS, **DUNGEON_TAGS, **COUNTRY_TAGS, **EXTRA_TAGS}
 
+# 标签弹窗控件 (标签值, imgui 标签)；"special" 由「排除随机生成」控制，不在弹窗中
+DUNGEON_RADIO_LABELS = tuple((k, f"{v}##dungeon") for k, v in DUNGEON_TAGS.items())
+COUNTRY_RADIO_LABELS = tuple((k, f"{v}##country") for k, v in COUNTRY_TAGS.items())
+EXTRA_CHECKBOX_LABELS = tuple(
+    (k, f"{v}##extra_{k}") for k, v in EXTRA_TAGS.items() if k != "special"
+)
+
 
 # ============== 匹配逻辑 ==============
 
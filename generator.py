@@ -18,8 +18,10 @@ except ImportError:
 from constants import (
     ARMOR_PREVIEW_HEIGHT,
     ARMOR_PREVIEW_WIDTH,
+    ATTRIBUTE_TO_GROUP,
     CONSUMABLE_INSTANT_ATTRS,
     DAMAGE_ATTRIBUTES,
+    DEFAULT_GROUP_ORDER,
     EXTRA_ORDER_ATTRS,
     GAME_FPS,
     GML_ANCHOR_X,
@@ -1761,8 +1763,6 @@ popz.v"""
         惰性初始化扩展的属性排序列表
         """
         # 按 ATTRIBUTE_TO_GROUP 的分组顺序排列额外属性（而非字母顺序）
-        from constants import ATTRIBUTE_TO_GROUP, DEFAULT_GROUP_ORDER
-        
         # 创建分组索引
         group_order_map = {g: i for i, g in enumerate(DEFAULT_GROUP_ORDER)}
         
@@ -5,14 +5,18 @@ Stoneshard 装备模组编辑器 - 主程序
 基于 ImGui 的图形界面，用于创建和编辑 Stoneshard 游戏的武器/装备模组。
 """
 
+import bisect
 import copy
 import json
 import os
 import sys
 import time
 import tkinter as tk
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog
+from types import MappingProxyType
+from typing import Mapping
 
 import glfw
 import imgui
@@ -20,10 +24,13 @@ from imgui.integrations.glfw import GlfwRenderer
 from OpenGL.GL import (
     GL_COLOR_BUFFER_BIT,
     GL_NEAREST,
+    GL_REPEAT,
     GL_RGBA,
     GL_TEXTURE_2D,
     GL_TEXTURE_MAG_FILTER,
     GL_TEXTURE_MIN_FILTER,
+    GL_TEXTURE_WRAP_S,
+    GL_TEXTURE_WRAP_T,
     GL_UNSIGNED_BYTE,
     glBindTexture,
     glClear,
@@ -57,6 +64,7 @@ from constants import (
     # 其他常量
     ARMOR_CLASS_LABELS,
     ARMOR_FRAGMENT_LABELS,
+    ARMOR_NO_FRAGMENT_SLOTS,
     ARMOR_PREVIEW_HEIGHT,
     ARMOR_PREVIEW_WIDTH,
     ARMOR_SLOT_LABELS,
@@ -66,17 +74,23 @@ from constants import (
     CHARACTER_MODELS,
     CHARACTER_RACE_LABELS,
     CHARACTER_RACES,
+    CHECKERBOARD_MIN_CELL_SIZE,
     GAME_FPS,
+    IDLE_SETTLE_FRAMES,
+    IDLE_WAIT_TIMEOUT,
     LANGUAGE_LABELS,
     LEFT_HAND_SLOTS,
     NEGATIVE_ATTRIBUTES,
     PREVIEW_ANIMATION_FPS,
     PRIMARY_LANGUAGE,
+    PRIMARY_LANGUAGE_LABEL,
+    RANGED_WEAPON_SLOTS,
     RARITY_LABELS,
     SLOT_LABELS,
     TAG_LABELS,
     TIER,
     TIER_LABELS,
+    UNIQUE_RARITY_TAGS,
     VALID_AREA_SIZE,
     VIEWPORT_CHAR_OFFSET_X,
     VIEWPORT_CHAR_OFFSET_Y,
@@ -86,10 +100,13 @@ from constants import (
     # 混合物品常量
     HYBRID_SLOT_LABELS,
     HYBRID_QUALITY_LABELS,
+    HYBRID_TIER_LABELS,
     HYBRID_WEAPON_TYPES,
+    HYBRID_WEAPON_TYPE_OPTIONS,
     HYBRID_DAMAGE_TYPES,
     HYBRID_MATERIALS,
     HYBRID_ARMOR_TYPES,
+    HYBRID_ARMOR_TYPE_OPTIONS,
     HYBRID_ARMOR_CLASSES,
     HYBRID_PICKUP_SOUNDS,
     HYBRID_DROP_SOUNDS,
@@ -115,7 +132,10 @@ from models import (
     TriggerMode,
     ChargeMode,
     Weapon,
+    QUALITY_ARTIFACT,
+    QUALITY_UNIQUE,
     validate_item,
+    validate_item_key,
     validate_hybrid_item,
 )
 from attribute_data import ATTRIBUTE_TRANSLATIONS, ATTRIBUTE_DESCRIPTIONS
@@ -128,6 +148,13 @@ from skill_constants import (
 from drop_slot_data import (
     ITEM_CATEGORIES,
     ALL_SUBCATEGORY_OPTIONS,
+    NON_TREASURE_SUBCATEGORY_OPTIONS,
+    CATEGORY_COMBO_LABELS,
+    SUBCAT_CHECKBOX_LABELS,
+    NON_TREASURE_SUBCAT_CHECKBOX_LABELS,
+    DUNGEON_RADIO_LABELS,
+    COUNTRY_RADIO_LABELS,
+    EXTRA_CHECKBOX_LABELS,
     CATEGORY_TRANSLATIONS,
     QUALITY_TAGS,
     DUNGEON_TAGS,
@@ -139,6 +166,13 @@ from drop_slot_data import (
 )
 from shop_configs import NPC_METADATA, SHOP_CONFIGS
 
+# 击杀掉落数据为生成文件，缺失时击杀预测面板显示未加载
+try:
+    from enemy_drop_constants import DROP_TABLE, ENEMY_META
+except ImportError:
+    DROP_TABLE = ENEMY_META = None
+
+@lru_cache(maxsize=None)
 def get_attr_display(attr: str, lang: str = "Chinese") -> tuple[str, str]:
     """获取属性的本地化显示名称和说明
     
@@ -160,6 +194,98 @@ def get_attr_display(attr: str, lang: str = "Chinese") -> tuple[str, str]:
     return (name, desc)
 
 
+@lru_cache(maxsize=None)
+def resolve_attr_displays(attributes: tuple[str, ...]) -> tuple[tuple[str, str, str], ...]:
+    """批量解析一组属性的 (属性键名, 显示名称, 详细说明)，按属性元组缓存"""
+    resolved = []
+    for attr in attributes:
+        name, desc = get_attr_display(attr)
+        resolved.append((attr, name or attr, desc))
+    return tuple(resolved)
+
+
+@lru_cache(maxsize=None)
+def basic_property_ids(id_suffix: str) -> Mapping[str, str]:
+    """基本属性面板中只随编辑器（weapon/armor）变化的标题与控件 ID，按 id_suffix 缓存
+
+    缓存结果在各帧间共享，返回只读映射以免调用方改写。
+    """
+    type_name = "武器" if id_suffix == "weapon" else "装备"
+    return MappingProxyType({
+        "sysid_title": f"{type_name}系统ID",
+        "sysid": f"##{id_suffix}_sysid",
+        "columns": f"basic_props_{id_suffix}",
+        "slot": f"##slot_{id_suffix}",
+        "tier": f"##tier_{id_suffix}",
+        "mat": f"##mat_{id_suffix}",
+        "class": f"##class_{id_suffix}",
+        "rarity": f"##rarity_{id_suffix}",
+        "price": f"##price_{id_suffix}",
+        "dur": f"##dur_{id_suffix}",
+        "rng": f"##rng_{id_suffix}",
+        "fireproof": f"防火##{id_suffix}",
+        "no_drop": f"不可掉落##{id_suffix}",
+        "is_open": f"开放式##{id_suffix}",
+    })
+
+
+@lru_cache(maxsize=None)
+def subcat_badge(subcat: str) -> tuple[str, str]:
+    """子分类 badge 的 (显示文本, 按钮 ID)，按子分类缓存"""
+    label = CATEGORY_TRANSLATIONS.get(subcat, subcat)
+    return label, f"{label}##{subcat}_badge"
+
+
+@lru_cache(maxsize=256)
+def hybrid_tag_badges(
+    quality_tag: str, dungeon_tag: str, country_tag: str,
+    extra_tags: tuple[str, ...], special: bool,
+) -> tuple[tuple[str, str, str, str, bool, str, str], ...]:
+    """解析混合物品已设置的标签 badge，按标签状态缓存
+
+    Returns:
+        (标签类型, 标签值, 显示文本, 主题颜色键, 可否移除, 锁定原因, 按钮 ID) 元组
+    """
+    badges = []
+    if quality_tag:
+        badges.append(("quality", quality_tag, QUALITY_TAGS.get(quality_tag, quality_tag),
+                       "badge_quality", False, "由品质自动设置"))
+    if dungeon_tag:
+        badges.append(("dungeon", dungeon_tag, DUNGEON_TAGS.get(dungeon_tag, dungeon_tag),
+                       "badge_tag", True, ""))
+    if country_tag:
+        badges.append(("country", country_tag, COUNTRY_TAGS.get(country_tag, country_tag),
+                       "badge_tag", True, ""))
+    for tag in extra_tags:
+        badges.append(("extra", tag, EXTRA_TAGS.get(tag, tag), "badge_tag", True, ""))
+    if special:
+        badges.append(("special", "special", EXTRA_TAGS.get("special", "special"),
+                       "badge_special", False, "由「排除随机生成」控制"))
+    return tuple(
+        (tag_type, tag_val, label, color_key, can_remove, locked_reason,
+         f"{label}##{tag_type}_{tag_val}_badge")
+        for tag_type, tag_val, label, color_key, can_remove, locked_reason in badges
+    )
+
+
+@lru_cache(maxsize=256)
+def parse_validation_message(message: str) -> tuple[str | None, str]:
+    """解析 validate_* 输出的一行消息，按消息字符串缓存
+
+    Returns:
+        (类型, 正文)，类型为 "warning" / "error"；物品标题行返回 (None, "")
+    """
+    content = message.lstrip()
+    # 绝大多数消息是 "•" 开头的条目，先判断单字符前缀
+    if content[:1] == "•":
+        if content.startswith("• WARNING:"):
+            return ("warning", content[10:].strip())  # 去掉 "• WARNING:" 前缀
+        return ("error", content[1:].strip())  # 去掉 "•" 前缀
+    if message.endswith("):"):
+        return (None, "")  # 物品标题行
+    return ("error", message)
+
+
 # ==================== ImGui 辅助函数 ====================
 # 减少重复的样板代码，提高信息密度
 
@@ -390,7 +516,7 @@ class GridLayout:
         """绘制 label header，占用 cols 列宽度"""
         target_w = self.layout.span(cols)
         self.text_secondary(text)
-        text_w = imgui.calc_text_size(text).x
+        text_w = imgui.get_item_rect_size().x  # 复用刚绘制的文本尺寸，免去再次测量
         if text_w < target_w:
             imgui.same_line(spacing=0)
             imgui.dummy(target_w - text_w, 0)
@@ -404,7 +530,7 @@ class GridLayout:
         target_w = self.layout.span(cols)
         imgui.align_text_to_frame_padding()
         imgui.text(text)
-        text_w = imgui.calc_text_size(text).x
+        text_w = imgui.get_item_rect_size().x
         if text_w < target_w:
             imgui.same_line(spacing=0)
             imgui.dummy(target_w - text_w, 0)
@@ -567,8 +693,7 @@ def framed_group(title: str = "", padding: float = 6.0):
         frame_max_y = imgui.get_cursor_screen_pos().y
         
         # 获取边框颜色
-        border_color = imgui.get_color_u32_rgba(0.4, 0.4, 0.4, 0.6)
-        bg_color = imgui.get_color_u32_rgba(0.0, 0.0, 0.0, 0.0)  # 透明背景
+        border_color = color_u32(0.4, 0.4, 0.4, 0.6)
         
         # 绘制边框（1px 实线）
         draw_list.add_rect(
@@ -593,7 +718,7 @@ def framed_group(title: str = "", padding: float = 6.0):
             )
             
             # 绘制标题文字
-            text_color = imgui.get_color_u32_rgba(0.6, 0.6, 0.6, 1.0)
+            text_color = color_u32(0.6, 0.6, 0.6, 1.0)
             draw_list.add_text(title_x, title_y, text_color, title)
 
 
@@ -603,6 +728,15 @@ def tooltip(text: str):
         imgui.set_tooltip(text)
 
 
+@lru_cache(maxsize=None)
+def color_u32(r: float, g: float, b: float, a: float = 1.0) -> int:
+    """固定 RGBA 颜色转 u32，按颜色值缓存
+
+    不乘 STYLE_ALPHA，仅用于常量颜色；跟随主题/样式的颜色仍用 get_color_u32_rgba。
+    """
+    return imgui.color_convert_float4_to_u32(r, g, b, a)
+
+
 class ModGeneratorGUI:
     """主 GUI 类"""
 
@@ -642,6 +776,7 @@ class ModGeneratorGUI:
         self.is_dark_theme = True
         self.texture_scale = 4.0
         self.should_reload_fonts = False
+        self._saved_config = None  # 上次读写的配置内容，用于跳过无变化的保存
 
         # 加载配置
         self.load_config()
@@ -663,9 +798,14 @@ class ModGeneratorGUI:
         self.import_conflicts = []
         self.current_texture_field = ""
         self.texture_preview_cache = {}
+        self.validation_cache = {}  # id(item) -> (物品, 校验状态键, 校验结果)，删除物品/切换项目时清理
+        self._tk_root = None  # 文件对话框共用的隐藏 Tk 根窗口
+        self.checkerboard_tex_id = None  # 2x2 棋盘格平铺贴图，首次绘制时创建
         self.selected_model = "Human Male"
         self.selected_race = "Human"  # 多姿势编辑器中的人种选择
         self.preview_states = {}
+        self.hybrid_base_heights = {}  # id(hybrid) -> (物品, 基础区块上次绘制的高度)
+        self.animation_active = False  # 本帧是否有动画预览在播放
         self.active_item_tab = 0
         self.gender_tab_index = 0  # 0=男性, 1=女性
 
@@ -692,11 +832,15 @@ class ModGeneratorGUI:
                     self.fallback_font_path = config.get("fallback_font_path", "")
                     self.is_dark_theme = config.get("is_dark_theme", True)
                     self.texture_scale = config.get("texture_scale", 4.0)
+                self._saved_config = config
             except Exception as e:
                 print(f"加载配置失败: {e}")
 
     def save_config(self):
-        """保存用户配置"""
+        """保存用户配置
+
+        与上次写入的内容相同则跳过；先写临时文件再替换，避免中途失败留下半截配置。
+        """
         config = {
             "font_size": self.font_size,
             "primary_font_path": self.primary_font_path,
@@ -704,9 +848,15 @@ class ModGeneratorGUI:
             "is_dark_theme": self.is_dark_theme,
             "texture_scale": self.texture_scale,
         }
+        if config == self._saved_config:
+            return
+        config_path = "config.json"
+        tmp_path = config_path + ".tmp"
         try:
-            with open("config.json", "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(config, f, indent=4)
+            os.replace(tmp_path, config_path)
+            self._saved_config = config
         except Exception as e:
             print(f"保存配置失败: {e}")
 
@@ -756,6 +906,11 @@ class ModGeneratorGUI:
         else:
             self._apply_light_theme(style)
 
+        # 缩进分隔线的间距与颜色只随主题/字号变化，在此算好供逐帧复用
+        self.separator_gap = style.item_spacing.y * 0.3
+        # 主题颜色：仍经 get_color_u32_rgba 乘上 style.alpha（color_u32 只用于常量颜色）
+        self.separator_color = imgui.get_color_u32_rgba(*style.colors[imgui.COLOR_SEPARATOR])
+
     def _apply_dark_theme(self, style):
         """暗色主题 - 高对比、护眼、专业"""
         # 基础色板 (对比 Contrast)
@@ -1003,10 +1158,24 @@ class ModGeneratorGUI:
     def run(self):
         """主循环"""
         running = True
+        idle_frames = 0  # 距上次输入事件已刷新的帧数
         while running:
             if glfw.window_should_close(self.window):
                 running = False
-            glfw.poll_events()
+            # 无输入、无交互、无动画时阻塞等待事件，避免空闲时每帧重建整个界面
+            if (
+                idle_frames >= IDLE_SETTLE_FRAMES
+                and not self.animation_active
+                and not imgui.is_any_item_active()
+                and not imgui.is_mouse_down(0)
+            ):
+                wait_start = glfw.get_time()
+                glfw.wait_events_timeout(IDLE_WAIT_TIMEOUT)
+                if glfw.get_time() - wait_start < IDLE_WAIT_TIMEOUT:
+                    idle_frames = 0  # 被输入事件唤醒，多刷新几帧让界面状态稳定
+            else:
+                glfw.poll_events()
+                idle_frames += 1
             self.renderer.process_inputs()
 
             if self.should_reload_fonts:
@@ -1015,6 +1184,7 @@ class ModGeneratorGUI:
                 self.should_reload_fonts = False
 
             imgui.new_frame()
+            self.animation_active = False
 
             self.draw_main_menu()
             self.draw_main_interface()
@@ -1031,6 +1201,8 @@ class ModGeneratorGUI:
             glfw.swap_buffers(self.window)
 
         self.clear_texture_previews()
+        if self._tk_root is not None:
+            self._tk_root.destroy()
         self.renderer.shutdown()
         glfw.terminate()
 
@@ -1559,8 +1731,12 @@ class ModGeneratorGUI:
         default_desc,
         default_id_base,
         get_display_suffix,
+        key_attr="name",
     ):
-        """通用物品列表绘制"""
+        """通用物品列表绘制
+
+        key_attr: 物品系统ID所在字段（武器/装备为 name，混合物品为 id）
+        """
         current_index = getattr(self, current_index_attr)
         available_width = imgui.get_content_region_available_width()
 
@@ -1568,7 +1744,7 @@ class ModGeneratorGUI:
         # 添加按钮
         if imgui.button(f"添加##{item_type_label}"):
             new_item = item_class()
-            new_item.name = self._generate_unique_id(items, default_id_base)
+            setattr(new_item, key_attr, self._generate_unique_id(items, default_id_base, key_attr))
             new_item.localization.set_name(PRIMARY_LANGUAGE, default_name)
             new_item.localization.set_description(PRIMARY_LANGUAGE, default_desc)
             items.append(new_item)
@@ -1583,7 +1759,8 @@ class ModGeneratorGUI:
         if not can_delete:
             imgui.push_style_var(imgui.STYLE_ALPHA, 0.5)
         if imgui.button(f"删除##{item_type_label}") and can_delete:
-            del items[current_index]
+            removed_item = items.pop(current_index)
+            self._forget_item_caches(removed_item)
             setattr(self, current_index_attr, min(current_index, len(items) - 1))
         if not can_delete:
             imgui.pop_style_var()
@@ -1600,14 +1777,14 @@ class ModGeneratorGUI:
             source_item = items[current_index]
             new_item = copy.deepcopy(source_item)
 
-            existing_names = {item.name for item in items}
-            base_name = f"{source_item.name}_copy"
+            existing_names = {getattr(item, key_attr) for item in items}
+            base_name = f"{getattr(source_item, key_attr)}_copy"
             new_name = base_name
             idx = 1
             while new_name in existing_names:
                 new_name = f"{base_name}_{idx}"
                 idx += 1
-            new_item.name = new_name
+            setattr(new_item, key_attr, new_name)
 
             primary_name = new_item.localization.get_name(PRIMARY_LANGUAGE)
             if primary_name:
@@ -1650,9 +1827,9 @@ class ModGeneratorGUI:
             if imgui.is_item_hovered():
                 imgui.set_tooltip(f"ID: {item.id}{suffix}")
 
-    def _generate_unique_id(self, items, base_id):
+    def _generate_unique_id(self, items, base_id, key_attr="name"):
         """生成唯一的默认ID"""
-        existing = {getattr(item, 'id', getattr(item, 'name', '')) for item in items}
+        existing = {getattr(item, key_attr) for item in items}
         if base_id not in existing:
             return base_id
 
@@ -1688,7 +1865,7 @@ class ModGeneratorGUI:
             self._draw_textures_editor(weapon, "weapon", SLOT_LABELS)
             imgui.tree_pop()
 
-        errors = validate_item(weapon, self.project, include_warnings=True)
+        errors = self._validate_item_cached(weapon)
         self._draw_validation_errors(errors)
 
     # ==================== 护甲编辑器 ====================
@@ -1708,10 +1885,10 @@ class ModGeneratorGUI:
             imgui.tree_pop()
 
         # 项链、戒指、盾牌不允许拆解材料
-        no_fragment_slots = ["Ring", "Amulet", "shield"]
-        if armor.slot in no_fragment_slots:
-            # 强制清空拆解材料
-            armor.fragments.clear()
+        if armor.slot in ARMOR_NO_FRAGMENT_SLOTS:
+            # 强制清空拆解材料（已为空时不再改动）
+            if armor.fragments:
+                armor.fragments.clear()
         else:
             if imgui.tree_node("拆解材料", flags=imgui.TREE_NODE_FRAMED):
                 self._draw_fragments_editor(armor)
@@ -1725,7 +1902,7 @@ class ModGeneratorGUI:
             self._draw_textures_editor(armor, "armor", ARMOR_SLOT_LABELS)
             imgui.tree_pop()
 
-        errors = validate_item(armor, self.project, include_warnings=True)
+        errors = self._validate_item_cached(armor)
         self._draw_validation_errors(errors)
 
     # ==================== 混合物品列表和编辑器 ====================
@@ -1741,6 +1918,7 @@ class ModGeneratorGUI:
             default_desc="这是新混合物品的描述",
             default_id_base="请设置混合物品系统ID",
             get_display_suffix=lambda item: f" [{HYBRID_SLOT_LABELS.get(item.slot, item.slot)}]",
+            key_attr="id",
         )
 
     def draw_hybrid_editor(self):
@@ -1782,7 +1960,19 @@ class ModGeneratorGUI:
 
     def _draw_hybrid_base(self, hybrid: HybridItem):
         """绘制基础区块 - GridLayout label-on-top 布局（两行）"""
-        hybrid.parent_object = "o_inv_consum"
+        # 父对象固定为 o_inv_consum，仅在不一致时（如旧数据）改写
+        if hybrid.parent_object != "o_inv_consum":
+            hybrid.parent_object = "o_inv_consum"
+
+        # 整个区块滚出可视区域时按上次绘制的高度占位，跳过全部控件构建
+        cached = self.hybrid_base_heights.get(id(hybrid))
+        block_height = cached[1] if cached and cached[0] is hybrid else None
+        if block_height and not imgui.is_rect_visible(
+            imgui.get_content_region_available_width(), block_height
+        ):
+            imgui.dummy(0, block_height - imgui.get_style().item_spacing.y)
+            return
+        block_start_y = imgui.get_cursor_pos_y()
 
         # 使用 GridLayout 类
         grid = GridLayout(self.layout, self.text_secondary)
@@ -1808,20 +1998,23 @@ class ModGeneratorGUI:
         old_quality = hybrid.quality
         hybrid.quality = self._draw_enum_combo(
             "##quality_hybrid", hybrid.quality,
-            list(HYBRID_QUALITY_LABELS.keys()), HYBRID_QUALITY_LABELS
+            HYBRID_QUALITY_LABELS, HYBRID_QUALITY_LABELS
         )
         if hybrid.quality != old_quality:
             self._update_hybrid_rarity_from_quality(hybrid)
+        # 品质只在上面的下拉框中改变，之后各行共用这次判断
+        is_treasure = hybrid.quality == QUALITY_ARTIFACT
 
         grid.next_cell()
         grid.field_width(L.SPAN_INPUT)
-        if hybrid.quality == 7:
+        if is_treasure:
             grid.text_cell("T0", L.SPAN_INPUT)
             tooltip("文物固定等级 0")
         else:
-            tier_options = [0, 1, 2, 3, 4, 5]
-            tier_labels = {0: "全", 1: "1", 2: "2", 3: "3", 4: "4", 5: "5"}
-            hybrid.tier = self._draw_enum_combo("##tier_hybrid", hybrid.tier, tier_options, tier_labels)
+            hybrid.tier = self._draw_enum_combo(
+                "##tier_hybrid", hybrid.tier,
+                HYBRID_TIER_LABELS, HYBRID_TIER_LABELS
+            )
             tooltip("用于掉落/商店筛选")
 
         # === 第二行：价格 / 重量 / 材质 / 分类（物理/经济属性 + 分类）===
@@ -1844,7 +2037,7 @@ class ModGeneratorGUI:
         grid.field_width(L.SPAN_INPUT)
         hybrid.weight = self._draw_enum_combo(
             "##weight_hybrid", hybrid.weight,
-            list(HYBRID_WEIGHT_LABELS.keys()), HYBRID_WEIGHT_LABELS
+            HYBRID_WEIGHT_LABELS, HYBRID_WEIGHT_LABELS
         )
         tooltip("影响游泳；护甲时决定类别")
 
@@ -1852,62 +2045,53 @@ class ModGeneratorGUI:
         grid.field_width(L.SPAN_INPUT)
         hybrid.material = self._draw_enum_combo(
             "##material_hybrid", hybrid.material,
-            list(HYBRID_MATERIALS.keys()), HYBRID_MATERIALS
+            HYBRID_MATERIALS, HYBRID_MATERIALS
         )
 
         grid.next_cell()
-        # 分类下拉：文物固定为 treasure
-        is_treasure = hybrid.quality == 7
-        if is_treasure:
-            hybrid.cat = "treasure"
-        elif hybrid.cat == "treasure":
-            hybrid.cat = ""
-        
+        # 分类下拉：文物固定为 treasure（由 sync_quality_fields 维护）
         available_cats = [c for c in ITEM_CATEGORIES if c != "treasure"] if not is_treasure else ["treasure"]
         cat_options = (["treasure"] if is_treasure else [""]) + ([] if is_treasure else available_cats)
-        cat_labels = {"": "—"}
-        cat_labels.update({c: CATEGORY_TRANSLATIONS.get(c, c) for c in ITEM_CATEGORIES})
         
         if is_treasure:
             imgui.push_style_var(imgui.STYLE_ALPHA, 0.6)
         grid.field_width(L.SPAN_INPUT)
-        new_cat = self._draw_enum_combo("##cat_hybrid", hybrid.cat, cat_options, cat_labels)
+        new_cat = self._draw_enum_combo("##cat_hybrid", hybrid.cat, cat_options, CATEGORY_COMBO_LABELS)
         if not is_treasure:
             hybrid.cat = new_cat
         if is_treasure:
             imgui.pop_style_var()
 
+        # 子分类/标签两行 badge 共用的尺寸，循环内不再逐个读取
+        flow_width = L.span(8)  # 限制在8列宽度内换行
+        badge_width = L.span(L.SPAN_BADGE)
+        frame_padding = imgui.get_style().frame_padding
+        badge_padding = (0, frame_padding.y)
+        badge_text_width = badge_width - 2 * frame_padding.x
+
         # === 第三行：子分类（Grid对齐流式布局）===
         grid.label_header("子分类", L.SPAN_INPUT)
         
-        subcat_options = ALL_SUBCATEGORY_OPTIONS if hybrid.quality == 7 else [s for s in ALL_SUBCATEGORY_OPTIONS if s != "treasure"]
-        if "treasure" in hybrid.subcats and hybrid.quality != 7:
-            hybrid.subcats.remove("treasure")
-        
-        grid.begin_flow(L.span(8))  # 限制在8列宽度内换行
+        grid.begin_flow(flow_width)
         
         # 添加子分类按钮 (span=1)
-        if imgui.button("+##add_subcat", L.span(L.SPAN_BADGE), 0):
+        if imgui.button("+##add_subcat", badge_width, 0):
             imgui.open_popup("subcats_popup")
         tooltip("添加子分类")
         grid.flow_item_after()
         
         # 显示已选子分类 badges (固定 span=1 宽度)
-        badge_width = L.span(L.SPAN_BADGE)
         to_remove_subcat = None
-        for subcat in sorted(hybrid.subcats):
-            full_label = CATEGORY_TRANSLATIONS.get(subcat, subcat)
+        for subcat in hybrid.subcats:  # 插入时已保持有序
+            full_label, badge_id = subcat_badge(subcat)
             # 检测是否需要截断
-            text_size = imgui.calc_text_size(full_label)
-            style = imgui.get_style()
-            available_width = badge_width - 2 * style.frame_padding.x
-            is_truncated = text_size.x > available_width
+            is_truncated = imgui.calc_text_size(full_label).x > badge_text_width
             
             grid.flow_item(badge_width)
-            imgui.push_style_var(imgui.STYLE_FRAME_PADDING, (0, style.frame_padding.y))
+            imgui.push_style_var(imgui.STYLE_FRAME_PADDING, badge_padding)
             imgui.push_style_color(imgui.COLOR_BUTTON, *self.theme_colors["badge_subcat"])
             imgui.push_style_color(imgui.COLOR_BUTTON_HOVERED, *self.theme_colors["badge_hover_remove"])
-            if imgui.button(f"{full_label}##{subcat}_badge", badge_width, 0):
+            if imgui.button(badge_id, badge_width, 0):
                 to_remove_subcat = subcat
             imgui.pop_style_color(2)
             imgui.pop_style_var()
@@ -1922,18 +2106,17 @@ class ModGeneratorGUI:
             hybrid.subcats.remove(to_remove_subcat)
         
         if imgui.begin_popup("subcats_popup"):
-            for subcat in subcat_options:
-                is_selected = subcat in hybrid.subcats
+            selected_subcats = set(hybrid.subcats)  # 每个选项都要查询，先转为集合
+            checkbox_labels = SUBCAT_CHECKBOX_LABELS if is_treasure else NON_TREASURE_SUBCAT_CHECKBOX_LABELS
+            for subcat, checkbox_label in checkbox_labels:
+                is_selected = subcat in selected_subcats
                 is_disabled = (subcat == hybrid.cat)
                 if is_disabled:
                     imgui.push_style_var(imgui.STYLE_ALPHA, 0.5)
-                changed, new_value = imgui.checkbox(
-                    f"{CATEGORY_TRANSLATIONS.get(subcat, subcat)}##subcat_{subcat}",
-                    is_selected
-                )
+                changed, new_value = imgui.checkbox(checkbox_label, is_selected)
                 if changed and not is_disabled:
                     if new_value:
-                        hybrid.subcats.append(subcat)
+                        bisect.insort(hybrid.subcats, subcat)
                     else:
                         hybrid.subcats.remove(subcat)
                 if is_disabled:
@@ -1945,76 +2128,39 @@ class ModGeneratorGUI:
         # === 第四行：标签（流式布局）===
         grid.label_header("标签", L.SPAN_INPUT)
         
-        # 品质标签实时更新
-        hybrid.quality_tag = "unique" if hybrid.quality == 6 else ""
-        
-        # 收集所有有效标签
-        all_set_tags = []
-        if hybrid.quality_tag:
-            all_set_tags.append(("quality", hybrid.quality_tag))
-        if hybrid.dungeon_tag:
-            all_set_tags.append(("dungeon", hybrid.dungeon_tag))
-        if hybrid.country_tag:
-            all_set_tags.append(("country", hybrid.country_tag))
-        for tag in hybrid.extra_tags:
-            all_set_tags.append(("extra", tag))
-        if hybrid.exclude_from_random:
-            all_set_tags.append(("special", "special"))
-        
-        grid.begin_flow(L.span(8))  # 限制在8列宽度内换行
+        grid.begin_flow(flow_width)
         
         # 添加标签按钮
-        if imgui.button("+##add_tag", L.span(L.SPAN_BADGE), 0):
+        if imgui.button("+##add_tag", badge_width, 0):
             imgui.open_popup("tags_popup")
         tooltip("添加标签")
         grid.flow_item_after()
         
         # 显示标签 badges (固定 span=1 宽度)
-        badge_width = L.span(L.SPAN_BADGE)
         to_remove_tag = None
-        for tag_type, tag_val in all_set_tags:
-            # 确定标签文本、颜色和可移除性
-            if tag_type == "quality":
-                full_label = QUALITY_TAGS.get(tag_val, tag_val)
-                badge_color = self.theme_colors["badge_quality"]
-                can_remove = False
-                locked_reason = "由品质自动设置"
-            elif tag_type == "dungeon":
-                full_label = DUNGEON_TAGS.get(tag_val, tag_val)
-                badge_color = self.theme_colors["badge_tag"]
-                can_remove = True
-                locked_reason = ""
-            elif tag_type == "country":
-                full_label = COUNTRY_TAGS.get(tag_val, tag_val)
-                badge_color = self.theme_colors["badge_tag"]
-                can_remove = True
-                locked_reason = ""
-            elif tag_type == "special":
-                full_label = EXTRA_TAGS.get(tag_val, tag_val)
-                badge_color = self.theme_colors["badge_special"]
-                can_remove = False
-                locked_reason = "由「排除随机生成」控制"
-            else:
-                full_label = EXTRA_TAGS.get(tag_val, tag_val)
-                badge_color = self.theme_colors["badge_tag"]
-                can_remove = True
-                locked_reason = ""
+        # 未设置任何标签（含 special）时直接跳过 badge 解析
+        if hybrid.exclude_from_random or hybrid.has_custom_tags():
+            tag_badges = hybrid_tag_badges(
+                hybrid.quality_tag, hybrid.dungeon_tag, hybrid.country_tag,
+                tuple(hybrid.extra_tags), hybrid.exclude_from_random,
+            )
+        else:
+            tag_badges = ()
+        for tag_type, tag_val, full_label, color_key, can_remove, locked_reason, badge_id in tag_badges:
+            badge_color = self.theme_colors[color_key]
             
             # 检测是否需要截断
-            text_size = imgui.calc_text_size(full_label)
-            style = imgui.get_style()
-            available_width = badge_width - 2 * style.frame_padding.x
-            is_truncated = text_size.x > available_width
+            is_truncated = imgui.calc_text_size(full_label).x > badge_text_width
             
             # 选择 hover 颜色
             hover_color = self.theme_colors["badge_hover_remove"] if can_remove else self.theme_colors["badge_hover_locked"]
             
             grid.flow_item(badge_width)
-            imgui.push_style_var(imgui.STYLE_FRAME_PADDING, (0, style.frame_padding.y))
+            imgui.push_style_var(imgui.STYLE_FRAME_PADDING, badge_padding)
             imgui.push_style_color(imgui.COLOR_BUTTON, *badge_color)
             imgui.push_style_color(imgui.COLOR_BUTTON_HOVERED, *hover_color)
             
-            if imgui.button(f"{full_label}##{tag_type}_{tag_val}_badge", badge_width, 0):
+            if imgui.button(badge_id, badge_width, 0):
                 if can_remove:
                     to_remove_tag = (tag_type, tag_val)
             imgui.pop_style_color(2)
@@ -2044,23 +2190,22 @@ class ModGeneratorGUI:
 
         if imgui.begin_popup("tags_popup"):
             self.text_secondary("地牢")
-            for tag_val, tag_label in DUNGEON_TAGS.items():
-                if imgui.radio_button(f"{tag_label}##dungeon", hybrid.dungeon_tag == tag_val):
+            for tag_val, radio_label in DUNGEON_RADIO_LABELS:
+                if imgui.radio_button(radio_label, hybrid.dungeon_tag == tag_val):
                     hybrid.dungeon_tag = tag_val
 
             imgui.separator()
             self.text_secondary("国家/地区")
-            for tag_val, tag_label in COUNTRY_TAGS.items():
-                if imgui.radio_button(f"{tag_label}##country", hybrid.country_tag == tag_val):
+            for tag_val, radio_label in COUNTRY_RADIO_LABELS:
+                if imgui.radio_button(radio_label, hybrid.country_tag == tag_val):
                     hybrid.country_tag = tag_val
 
             imgui.separator()
             self.text_secondary("其他")
-            for tag_val, tag_label in EXTRA_TAGS.items():
-                if tag_val == "special":
-                    continue
-                is_selected = tag_val in hybrid.extra_tags
-                changed, new_value = imgui.checkbox(f"{tag_label}##extra_{tag_val}", is_selected)
+            selected_extra = set(hybrid.extra_tags)
+            for tag_val, checkbox_label in EXTRA_CHECKBOX_LABELS:
+                is_selected = tag_val in selected_extra
+                changed, new_value = imgui.checkbox(checkbox_label, is_selected)
                 if changed:
                     if new_value:
                         hybrid.extra_tags.append(tag_val)
@@ -2069,6 +2214,7 @@ class ModGeneratorGUI:
             imgui.end_popup()
         
         grid.end_flow()
+        self.hybrid_base_heights[id(hybrid)] = (hybrid, imgui.get_cursor_pos_y() - block_start_y)
 
         # 注：生成规则已移至 _draw_hybrid_behavior 末尾
 
@@ -2312,10 +2458,7 @@ class ModGeneratorGUI:
 
     def _draw_kill_preview_simplified(self, hybrid: HybridItem):
         """简化版击杀掉落预测 - 显示可能掉落此物品的敌人"""
-        # 导入击杀掉落数据
-        try:
-            from enemy_drop_constants import DROP_TABLE, ENEMY_META
-        except ImportError:
+        if DROP_TABLE is None:
             self.text_secondary("  (击杀数据未加载)")
             return
         
@@ -2438,17 +2581,17 @@ class ModGeneratorGUI:
                 if is_col:
                     # Column - 红色半透明
                     w = col
-                    color = imgui.get_color_u32_rgba(1, 0.3, 0.3, 0.15)
+                    color = color_u32(1, 0.3, 0.3, 0.15)
                 else:
                     # Gap - 绿色半透明
                     w = gap
-                    color = imgui.get_color_u32_rgba(0.3, 1, 0.3, 0.25)
+                    color = color_u32(0.3, 1, 0.3, 0.25)
                 
                 # 绘制填充矩形
                 if x + w <= content_x + available_w:
                     draw_list.add_rect_filled(x, window_y, x + w, window_y + window_h, color)
                     # 边框线
-                    border_color = imgui.get_color_u32_rgba(1, 1, 1, 0.3)
+                    border_color = color_u32(1, 1, 1, 0.3)
                     draw_list.add_rect(x, window_y, x + w, window_y + window_h, border_color, 0, 0, 1.0)
                 
                 x += w
@@ -2492,7 +2635,7 @@ class ModGeneratorGUI:
             grid.field_width(L.SPAN_INPUT)
             hybrid.weapon_type = self._draw_enum_combo(
                 "##wep_type", hybrid.weapon_type,
-                list(HYBRID_WEAPON_TYPES.keys()), HYBRID_WEAPON_TYPES
+                HYBRID_WEAPON_TYPE_OPTIONS, HYBRID_WEAPON_TYPES
             )
             grid.next_cell()
             grid.field_width(L.SPAN_INPUT)
@@ -2507,7 +2650,7 @@ class ModGeneratorGUI:
             old_armor_type = hybrid.armor_type
             hybrid.armor_type = self._draw_enum_combo(
                 "##armor_type", hybrid.armor_type,
-                list(HYBRID_ARMOR_TYPES.keys()), HYBRID_ARMOR_TYPES
+                HYBRID_ARMOR_TYPE_OPTIONS, HYBRID_ARMOR_TYPES
             )
             if hybrid.armor_type != old_armor_type:
                 hybrid.slot = "hand" if hybrid.armor_type == "shield" else hybrid.armor_type
@@ -2728,12 +2871,10 @@ class ModGeneratorGUI:
         self._draw_localization_editor(hybrid, "hybrid")
 
     def _update_hybrid_rarity_from_quality(self, hybrid: HybridItem):
-        """根据品质自动更新稀有度"""
+        """根据品质自动更新稀有度及分类/品质标签"""
         # 普通(1) -> 空, 独特(6) -> "Unique", 文物(7) -> 空
-        if hybrid.quality == 6:
-            hybrid.rarity = "Unique"
-        else:
-            hybrid.rarity = ""
+        hybrid.rarity = "Unique" if hybrid.quality == QUALITY_UNIQUE else ""
+        hybrid.sync_quality_fields()
 
     def _draw_hybrid_weapon_settings(self, hybrid: HybridItem):
         """绘制混合物品武器设置 - 使用 Table API"""
@@ -2752,7 +2893,7 @@ class ModGeneratorGUI:
             with item_width(-1):
                 hybrid.weapon_type = self._draw_enum_combo(
                     "##wep_type", hybrid.weapon_type,
-                    list(HYBRID_WEAPON_TYPES.keys()), HYBRID_WEAPON_TYPES
+                    HYBRID_WEAPON_TYPE_OPTIONS, HYBRID_WEAPON_TYPES
                 )
             # hands 是计算属性，由 weapon_type 自动推断
             
@@ -2794,7 +2935,7 @@ class ModGeneratorGUI:
             with item_width(-1):
                 hybrid.armor_type = self._draw_enum_combo(
                     "##armor_type", hybrid.armor_type,
-                    list(HYBRID_ARMOR_TYPES.keys()), HYBRID_ARMOR_TYPES
+                    HYBRID_ARMOR_TYPE_OPTIONS, HYBRID_ARMOR_TYPES
                 )
             
             # 根据护甲类型自动设置槽位
@@ -2884,13 +3025,11 @@ class ModGeneratorGUI:
                         else:
                             imgui.table_setup_column(f"gap{i}", imgui.TABLE_COLUMN_WIDTH_FIXED, 0)
 
-                    for idx, attr in enumerate(attributes):
+                    for idx, (attr, desc_name, desc_detail) in enumerate(
+                        resolve_attr_displays(tuple(attributes))
+                    ):
                         if idx % cols == 0:
                             imgui.table_next_row()
-                        
-                        desc_name, desc_detail = get_attr_display(attr)
-                        if not desc_name:
-                            desc_name = attr
 
                         val = hybrid.attributes.get(attr, 0)
 
@@ -2989,14 +3128,12 @@ class ModGeneratorGUI:
                             else:
                                 imgui.table_setup_column(f"gap{i}", imgui.TABLE_COLUMN_WIDTH_FIXED, 0)
 
-                        for idx, attr in enumerate(attr_list):
+                        for idx, (attr, attr_name, attr_desc) in enumerate(
+                            resolve_attr_displays(tuple(attr_list))
+                        ):
                             if idx % cols == 0:
                                 imgui.table_next_row()
                             
-                            attr_name, attr_desc = get_attr_display(attr)
-                            if not attr_name:
-                                attr_name = attr
-                            
                             val = hybrid.consumable_attributes.get(attr, 0)
                             is_float_attr = attr in CONSUMABLE_FLOAT_ATTRIBUTES
                             
@@ -3282,7 +3419,7 @@ class ModGeneratorGUI:
         if hybrid.quality == 7:
             subcat_options = ALL_SUBCATEGORY_OPTIONS
         else:
-            subcat_options = [s for s in ALL_SUBCATEGORY_OPTIONS if s != "treasure"]
+            subcat_options = NON_TREASURE_SUBCATEGORY_OPTIONS
             # 如果当前选择了 treasure，移除它
             if "treasure" in hybrid.subcats:
                 hybrid.subcats.remove("treasure")
@@ -3306,7 +3443,7 @@ class ModGeneratorGUI:
             )
             if changed and not is_disabled:
                 if new_value:
-                    hybrid.subcats.append(subcat)
+                    bisect.insort(hybrid.subcats, subcat)
                 else:
                     hybrid.subcats.remove(subcat)
             
@@ -3727,14 +3864,18 @@ class ModGeneratorGUI:
 
     def _draw_basic_properties(self, item, id_suffix, slot_labels, material_labels):
         """绘制物品基本属性"""
-        type_name = "武器" if id_suffix == "weapon" else "装备"
+        ids = basic_property_ids(id_suffix)
+        # 物品类型在本帧内不变，只判断一次（Armor/Weapon 均无子类）
+        is_armor = type(item) is Armor
+        is_weapon = type(item) is Weapon
+        # 下拉框选项直接传标签字典：按键顺序迭代，成员判断 O(1)，无需每帧 list(keys())
 
         # 系统ID - 占满宽度
-        imgui.text(f"{type_name}系统ID")
+        imgui.text(ids["sysid_title"])
         imgui.same_line()
         self.text_secondary(f"(生成ID: {item.id})")
         imgui.push_item_width(-1)
-        changed, item.name = imgui.input_text(f"##{id_suffix}_sysid", item.name, 256)
+        changed, item.name = imgui.input_text(ids["sysid"], item.name, 256)
         imgui.pop_item_width()
         if imgui.is_item_hovered():
             imgui.set_tooltip(
@@ -3746,14 +3887,14 @@ class ModGeneratorGUI:
         # 使用两列布局
         col_width = imgui.get_content_region_available_width() / 2 - 8
 
-        imgui.columns(2, f"basic_props_{id_suffix}", border=False)
+        imgui.columns(2, ids["columns"], border=False)
         imgui.set_column_width(0, col_width)
 
         # 左列
         imgui.push_item_width(-1)
         imgui.text("槽位")
         new_slot = self._draw_enum_combo(
-            f"##slot_{id_suffix}", item.slot, list(slot_labels.keys()), slot_labels
+            ids["slot"], item.slot, slot_labels, slot_labels
         )
         if new_slot != item.slot:
             item.slot = new_slot
@@ -3764,23 +3905,23 @@ class ModGeneratorGUI:
 
         imgui.text("等级")
         item.tier = self._draw_enum_combo(
-            f"##tier_{id_suffix}", item.tier, TIER, TIER_LABELS
+            ids["tier"], item.tier, TIER, TIER_LABELS
         )
 
         imgui.text("材料")
         item.mat = self._draw_enum_combo(
-            f"##mat_{id_suffix}",
+            ids["mat"],
             item.mat,
-            list(material_labels.keys()),
+            material_labels,
             material_labels,
         )
 
-        if isinstance(item, Armor):
+        if is_armor:
             imgui.text("护甲类别")
             item.armor_class = self._draw_enum_combo(
-                f"##class_{id_suffix}",
+                ids["class"],
                 item.armor_class,
-                list(ARMOR_CLASS_LABELS.keys()),
+                ARMOR_CLASS_LABELS,
                 ARMOR_CLASS_LABELS,
             )
         imgui.pop_item_width()
@@ -3794,42 +3935,42 @@ class ModGeneratorGUI:
         new_tags = self._draw_enum_combo(
             f"##tags_{id_suffix}_{item.name}",
             item.tags,
-            list(TAG_LABELS.keys()),
+            TAG_LABELS,
             TAG_LABELS,
         )
         if new_tags != item.tags:
             item.tags = new_tags
             item.rarity = (
                 "Unique"
-                if new_tags in ["unique", "special", "special exc"]
+                if new_tags in UNIQUE_RARITY_TAGS
                 else "Common"
             )
 
         imgui.text("稀有度")
         rarity_label = RARITY_LABELS.get(item.rarity, item.rarity)
         imgui.input_text(
-            f"##rarity_{id_suffix}", rarity_label, 256, flags=imgui.INPUT_TEXT_READ_ONLY
+            ids["rarity"], rarity_label, 256, flags=imgui.INPUT_TEXT_READ_ONLY
         )
         if imgui.is_item_hovered():
             imgui.set_tooltip("由标签自动决定")
 
         imgui.text("价格")
-        changed, item.price = imgui.input_int(f"##price_{id_suffix}", item.price)
+        changed, item.price = imgui.input_int(ids["price"], item.price)
 
         imgui.text("最大耐久")
         changed, item.max_duration = imgui.input_int(
-            f"##dur_{id_suffix}", item.max_duration
+            ids["dur"], item.max_duration
         )
         imgui.pop_item_width()
 
         imgui.columns(1)
 
         # 武器距离（仅武器，弓弩专用）
-        if isinstance(item, Weapon):
-            if item.slot in ["bow", "crossbow"]:
+        if is_weapon:
+            if item.slot in RANGED_WEAPON_SLOTS:
                 imgui.push_item_width(120)
                 imgui.text("攻击距离")
-                changed, item.rng = imgui.input_int(f"##rng_{id_suffix}", item.rng)
+                changed, item.rng = imgui.input_int(ids["rng"], item.rng)
                 if changed:
                     item.rng = max(0, min(255, item.rng))
                 imgui.pop_item_width()
@@ -3845,16 +3986,16 @@ class ModGeneratorGUI:
         # 布尔属性 - 横向排列
         imgui.text("特殊属性")
         item.fireproof = self._draw_inline_checkbox(
-            f"防火##{id_suffix}", item.fireproof, "未被拾取时是否会被火焰摧毁"
+            ids["fireproof"], item.fireproof, "未被拾取时是否会被火焰摧毁"
         )
         imgui.same_line(spacing=self.layout.gap_l)
         item.no_drop = self._draw_inline_checkbox(
-            f"不可掉落##{id_suffix}", item.no_drop, "可能无法从宝箱中获取"
+            ids["no_drop"], item.no_drop, "可能无法从宝箱中获取"
         )
-        if isinstance(item, Armor):
+        if is_armor:
             imgui.same_line(spacing=self.layout.gap_l)
             item.is_open = self._draw_inline_checkbox(
-                f"开放式##{id_suffix}",
+                ids["is_open"],
                 item.is_open,
                 "装备是否为开放式设计（如头盔的面甲）",
             )
@@ -3876,11 +4017,9 @@ class ModGeneratorGUI:
                 input_col_width = 120 + (self.font_size - 14) * 6
                 imgui.set_column_width(0, input_col_width)
 
-                for attr in attributes:
-                    desc_name, desc_detail = get_attr_display(attr)
-                    if not desc_name:
-                        desc_name = attr
-
+                for attr, desc_name, desc_detail in resolve_attr_displays(
+                    tuple(attributes)
+                ):
                     val = item.attributes.get(attr, 0)
 
                     # 第一列：输入框
@@ -3930,11 +4069,10 @@ class ModGeneratorGUI:
             frag_label = ARMOR_FRAGMENT_LABELS.get(frag_type, frag_type)
             val = armor.fragments.get(frag_type, 0)
 
-            imgui.push_item_width(100)
+            imgui.set_next_item_width(100)
             changed, new_val = imgui.input_int(
                 f"##{frag_type}", val, step=1, step_fast=5
             )
-            imgui.pop_item_width()
 
             if new_val < 0:
                 new_val = 0
@@ -3955,6 +4093,8 @@ class ModGeneratorGUI:
     def _draw_localization_editor(self, item, id_suffix):
         """绘制本地化编辑器"""
         suffix = f"_{id_suffix}"
+        # 描述框高度随字体缩放
+        desc_height = 50 + (self.font_size - 14) * 3
 
         # 语言添加器
         if imgui.button(f"添加语言##{id_suffix}"):
@@ -3974,8 +4114,7 @@ class ModGeneratorGUI:
         imgui.dummy(0, self.layout.gap_s)
 
         # 主语言
-        primary_label = LANGUAGE_LABELS.get(PRIMARY_LANGUAGE, PRIMARY_LANGUAGE)
-        self.text_secondary(f"{primary_label} (主语言)")
+        self.text_secondary(f"{PRIMARY_LANGUAGE_LABEL} (主语言)")
 
         if not item.localization.has_language(PRIMARY_LANGUAGE):
             item.localization.languages[PRIMARY_LANGUAGE] = {
@@ -3998,8 +4137,6 @@ class ModGeneratorGUI:
 
         self.text_secondary("描述")
         imgui.push_item_width(-1)
-        # 描述框高度随字体缩放
-        desc_height = 50 + (self.font_size - 14) * 3
         changed, val = imgui.input_text_multiline(
             f"##{PRIMARY_LANGUAGE}_desc{suffix}",
             primary_data["description"],
@@ -4013,18 +4150,18 @@ class ModGeneratorGUI:
 
         # 其他语言
         langs_to_remove = []
-        for lang in LANGUAGE_LABELS:
+        languages = item.localization.languages
+        # 按 LANGUAGE_LABELS 顺序显示，标签随键一并取出
+        for lang, label in LANGUAGE_LABELS.items():
             if lang == PRIMARY_LANGUAGE:
                 continue
-            if not item.localization.has_language(lang):
+            data = languages.get(lang)
+            if data is None:
                 continue
 
-            data = item.localization.languages[lang]
-
             imgui.separator()
             imgui.dummy(0, self.layout.gap_s)
-            label = LANGUAGE_LABELS.get(lang, lang)
-            self.text_secondary(f"{label}")
+            self.text_secondary(label)
             imgui.same_line()
             if imgui.button(f"删除##{lang}{suffix}"):
                 langs_to_remove.append(lang)
@@ -4038,8 +4175,6 @@ class ModGeneratorGUI:
 
             self.text_secondary("描述")
             imgui.push_item_width(-1)
-            # 描述框高度随字体缩放
-            desc_height = 50 + (self.font_size - 14) * 3
             changed, val = imgui.input_text_multiline(
                 f"##{lang}_desc{suffix}", data["description"], 1024, height=desc_height
             )
@@ -4063,7 +4198,7 @@ class ModGeneratorGUI:
         # 预览设置 - 紧凑横向布局
         imgui.text("预览:")
         imgui.same_line()
-        imgui.push_item_width(120)
+        imgui.set_next_item_width(120)
         changed, self.texture_scale = imgui.input_float(
             f"##scale_{id_suffix}",
             self.texture_scale,
@@ -4071,7 +4206,6 @@ class ModGeneratorGUI:
             step_fast=1.0,
             format="%.1fx",
         )
-        imgui.pop_item_width()
         if changed:
             self.texture_scale = max(0.5, min(8.0, self.texture_scale))
             self.save_config()
@@ -4083,11 +4217,7 @@ class ModGeneratorGUI:
         # 穿戴/手持状态贴图
         if item.needs_char_texture():
             # 判断是否为多姿势护甲（头/身/手/腿/背）
-            is_multi_pose_armor = (
-                isinstance(item, Armor) and item.needs_multi_pose_textures()
-            )
-
-            if is_multi_pose_armor:
+            if item.needs_multi_pose_textures():
                 # 多姿势护甲 UI（内部自带人种选择）
                 self._draw_multi_pose_armor_textures(item, id_suffix)
             else:
@@ -4351,11 +4481,8 @@ class ModGeneratorGUI:
         if standing1_path:
             imgui.same_line()
             if imgui.small_button(f"清除##s1c_m_{id_suffix}"):
-                item.textures.character_standing1 = ""
-                item.textures.offset_x_standing1 = 0
-                item.textures.offset_y_standing1 = 0
                 # 同时清除女性版站立姿势1
-                item.textures.clear_female_standing1()
+                item.textures.clear_standing1()
             if imgui.is_item_hovered():
                 imgui.set_tooltip("清除贴图（同时清除女性版站立姿势1）")
 
@@ -4672,7 +4799,7 @@ class ModGeneratorGUI:
         imgui.same_line(spacing=self.layout.gap_xs)
         imgui.text("X")
         imgui.same_line(spacing=self.layout.gap_xs)
-        imgui.push_item_width(input_w)
+        imgui.set_next_item_width(input_w)
         if disabled:
             imgui.input_int(
                 f"##offx_{id_suffix}",
@@ -4687,7 +4814,6 @@ class ModGeneratorGUI:
             )
             if changed_x:
                 new_x = val_x
-        imgui.pop_item_width()
         imgui.same_line(spacing=self.layout.gap_xs)
         if imgui.button(f"+##xp_{id_suffix}", width=btn_w) and not disabled:
             new_x = off_x + 1
@@ -4700,7 +4826,7 @@ class ModGeneratorGUI:
         imgui.same_line(spacing=self.layout.gap_xs)
         imgui.text("Y")
         imgui.same_line(spacing=self.layout.gap_xs)
-        imgui.push_item_width(input_w)
+        imgui.set_next_item_width(input_w)
         if disabled:
             imgui.input_int(
                 f"##offy_{id_suffix}",
@@ -4715,7 +4841,6 @@ class ModGeneratorGUI:
             )
             if changed_y:
                 new_y = val_y
-        imgui.pop_item_width()
         imgui.same_line(spacing=self.layout.gap_xs)
         if imgui.button(f"+##yp_{id_suffix}", width=btn_w) and not disabled:
             new_y = off_y + 1
@@ -4807,13 +4932,12 @@ class ModGeneratorGUI:
         imgui.same_line(spacing=sp)
         imgui.text("X")
         imgui.same_line(spacing=sp)
-        imgui.push_item_width(input_w)
+        imgui.set_next_item_width(input_w)
         changed_x, val_x = imgui.input_int(
             f"##offx_{id_suffix}", off_x, step=0, step_fast=0
         )
         if changed_x:
             new_x = val_x
-        imgui.pop_item_width()
         imgui.same_line(spacing=sp)
         if imgui.button(f"+##xp_{id_suffix}", width=btn_w):
             new_x = off_x + 1
@@ -4825,13 +4949,12 @@ class ModGeneratorGUI:
         imgui.same_line(spacing=sp)
         imgui.text("Y")
         imgui.same_line(spacing=sp)
-        imgui.push_item_width(input_w)
+        imgui.set_next_item_width(input_w)
         changed_y, val_y = imgui.input_int(
             f"##offy_{id_suffix}", off_y, step=0, step_fast=0
         )
         if changed_y:
             new_y = val_y
-        imgui.pop_item_width()
         imgui.same_line(spacing=sp)
         if imgui.button(f"+##yp_{id_suffix}", width=btn_w):
             new_y = off_y + 1
@@ -4865,18 +4988,17 @@ class ModGeneratorGUI:
         preview_h = ARMOR_PREVIEW_HEIGHT * scale
 
         draw_list = imgui.get_window_draw_list()
-        start_pos = imgui.get_cursor_screen_pos()
+        start_x, start_y = imgui.get_cursor_screen_pos()
 
         # 获取裁剪矩形
-        clip_rect = draw_list.get_clip_rect_min(), draw_list.get_clip_rect_max()
-        clip_min_x, clip_min_y = clip_rect[0]
-        clip_max_x, clip_max_y = clip_rect[1]
+        clip_min_x, clip_min_y = draw_list.get_clip_rect_min()
+        clip_max_x, clip_max_y = draw_list.get_clip_rect_max()
 
         # 计算预览区域与窗口裁剪区域的交集
-        preview_clip_min_x = max(start_pos[0], clip_min_x)
-        preview_clip_min_y = max(start_pos[1], clip_min_y)
-        preview_clip_max_x = min(start_pos[0] + preview_w, clip_max_x)
-        preview_clip_max_y = min(start_pos[1] + preview_h, clip_max_y)
+        preview_clip_min_x = max(start_x, clip_min_x)
+        preview_clip_min_y = max(start_y, clip_min_y)
+        preview_clip_max_x = min(start_x + preview_w, clip_max_x)
+        preview_clip_max_y = min(start_y + preview_h, clip_max_y)
 
         # 只有当裁剪区域有效时才绘制
         if (
@@ -4893,8 +5015,8 @@ class ModGeneratorGUI:
             # 绘制棋盘格背景
             self.draw_checkerboard(
                 draw_list,
-                start_pos,
-                (start_pos[0] + preview_w, start_pos[1] + preview_h),
+                (start_x, start_y),
+                (start_x + preview_w, start_y + preview_h),
                 cell_size=int(8 * scale),
             )
 
@@ -4913,10 +5035,10 @@ class ModGeneratorGUI:
                 if ref_preview:
                     draw_list.add_image(
                         ref_preview["tex_id"],
-                        (float(start_pos[0]), float(start_pos[1])),
+                        (start_x, start_y),
                         (
-                            float(start_pos[0] + ref_preview["width"] * scale),
-                            float(start_pos[1] + ref_preview["height"] * scale),
+                            float(start_x + ref_preview["width"] * scale),
+                            float(start_y + ref_preview["height"] * scale),
                         ),
                     )
 
@@ -4949,8 +5071,8 @@ class ModGeneratorGUI:
                             off_y = item.textures.offset_y_rest
 
                     # 计算绘制位置（偏移向负方向移动贴图）
-                    armor_x = start_pos[0] - off_x * scale
-                    armor_y = start_pos[1] - off_y * scale
+                    armor_x = start_x - off_x * scale
+                    armor_y = start_y - off_y * scale
 
                     draw_list.add_image(
                         preview["tex_id"],
@@ -5001,7 +5123,8 @@ class ModGeneratorGUI:
         imgui.same_line()
 
         label_suffix = f"_{id_suffix}_{field_name}"
-        state_key = f"{id_suffix}_{field_name}"
+        # 以 (id_suffix, field_name) 元组作为键，两者均为字面量常量，避免每帧格式化新字符串
+        state_key = (id_suffix, field_name)
         is_animated = len(texture_list) > 1
 
         if is_animated:
@@ -5010,10 +5133,7 @@ class ModGeneratorGUI:
             if imgui.is_item_hovered():
                 # 战利品贴图速度可变，其他使用预览默认速度
                 if field_name == "loot" and item:
-                    if item.textures.loot_use_relative_speed:
-                        actual_fps = GAME_FPS * item.textures.loot_fps
-                    else:
-                        actual_fps = item.textures.loot_fps
+                    actual_fps = item.textures.loot_preview_fps()
                     fps_hint = f"预览播放速度: {actual_fps:.1f} fps (可在下方调整)"
                 else:
                     fps_hint = f"预览播放速度: {PREVIEW_ANIMATION_FPS} fps"
@@ -5030,9 +5150,12 @@ class ModGeneratorGUI:
                 texture_list.clear()
 
             # 播放控制
-            state = self.preview_states.get(
-                state_key, {"paused": False, "current_frame": 0}
-            )
+            state = self.preview_states.get(state_key)
+            if state is None:
+                state = self.preview_states[state_key] = {
+                    "paused": False,
+                    "current_frame": 0,
+                }
             imgui.same_line()
             if imgui.checkbox(f"暂停##{label_suffix}", state["paused"])[0]:
                 state["paused"] = not state["paused"]
@@ -5068,8 +5191,6 @@ class ModGeneratorGUI:
                 imgui.same_line()
                 imgui.text(f"帧: {state['current_frame'] + 1}/{max_frame + 1}")
 
-            self.preview_states[state_key] = state
-
             # 帧列表管理
             if imgui.tree_node(f"帧列表##{label_suffix}"):
                 self._draw_frame_list_manager(texture_list, label_suffix)
@@ -5167,7 +5288,7 @@ class ModGeneratorGUI:
             frames.pop(i)
 
     def _draw_animated_texture_preview(
-        self, texture_list: list, field_name: str, item, state_key: str, id_suffix: str
+        self, texture_list: list, field_name: str, item, state_key: tuple, id_suffix: str
     ):
         """绘制动画贴图预览"""
         if not texture_list:
@@ -5176,19 +5297,15 @@ class ModGeneratorGUI:
         # 计算当前帧
         fps = PREVIEW_ANIMATION_FPS
         if field_name == "loot" and item:
-            fps = (
-                GAME_FPS * item.textures.loot_fps
-                if item.textures.loot_use_relative_speed
-                else item.textures.loot_fps
-            )
+            fps = item.textures.loot_preview_fps()
 
-        state = self.preview_states.get(
-            state_key, {"paused": False, "current_frame": 0}
-        )
-        if state.get("paused") and len(texture_list) > 1:
+        state = self.preview_states.get(state_key)
+        if state and state["paused"] and len(texture_list) > 1:
             frame_idx = min(state["current_frame"], len(texture_list) - 1)
         else:
             frame_idx = int(time.time() * fps) % len(texture_list)
+            if len(texture_list) > 1:
+                self.animation_active = True
 
         preview_path = texture_list[frame_idx]
 
@@ -5352,12 +5469,11 @@ class ModGeneratorGUI:
             is_handheld = True
 
         draw_list = imgui.get_window_draw_list()
-        start_pos = imgui.get_cursor_screen_pos()
+        start_x, start_y = imgui.get_cursor_screen_pos()
 
         # 获取当前 draw list 的裁剪矩形，这会正确反映窗口层级的裁剪
-        clip_rect = draw_list.get_clip_rect_min(), draw_list.get_clip_rect_max()
-        clip_min_x, clip_min_y = clip_rect[0]
-        clip_max_x, clip_max_y = clip_rect[1]
+        clip_min_x, clip_min_y = draw_list.get_clip_rect_min()
+        clip_max_x, clip_max_y = draw_list.get_clip_rect_max()
 
         if is_handheld:
             target_item = item
@@ -5411,10 +5527,10 @@ class ModGeneratorGUI:
                 viewport_h = VALID_AREA_SIZE * scale
 
                 # 计算预览区域与窗口裁剪区域的交集
-                preview_clip_min_x = max(start_pos[0], clip_min_x)
-                preview_clip_min_y = max(start_pos[1], clip_min_y)
-                preview_clip_max_x = min(start_pos[0] + viewport_w, clip_max_x)
-                preview_clip_max_y = min(start_pos[1] + viewport_h, clip_max_y)
+                preview_clip_min_x = max(start_x, clip_min_x)
+                preview_clip_min_y = max(start_y, clip_min_y)
+                preview_clip_max_x = min(start_x + viewport_w, clip_max_x)
+                preview_clip_max_y = min(start_y + viewport_h, clip_max_y)
 
                 # 只有当裁剪区域有效时才绘制
                 if (
@@ -5430,13 +5546,13 @@ class ModGeneratorGUI:
 
                     self.draw_checkerboard(
                         draw_list,
-                        start_pos,
-                        (start_pos[0] + viewport_w, start_pos[1] + viewport_h),
+                        (start_x, start_y),
+                        (start_x + viewport_w, start_y + viewport_h),
                         cell_size=int(8 * scale),
                     )
 
-                    char_draw_x = start_pos[0] + VIEWPORT_CHAR_OFFSET_X * scale
-                    char_draw_y = start_pos[1] + VIEWPORT_CHAR_OFFSET_Y * scale
+                    char_draw_x = start_x + VIEWPORT_CHAR_OFFSET_X * scale
+                    char_draw_y = start_y + VIEWPORT_CHAR_OFFSET_Y * scale
 
                     wep_rel_x = -off_x
                     wep_rel_y = -off_y
@@ -5444,49 +5560,35 @@ class ModGeneratorGUI:
                     wep_draw_x = char_draw_x + wep_rel_x * scale
                     wep_draw_y = char_draw_y + wep_rel_y * scale
 
+                    # 两种绘制顺序共用的矩形角点
+                    wep_min = (float(wep_draw_x), float(wep_draw_y))
+                    wep_max = (
+                        float(wep_draw_x + tex_w * scale),
+                        float(wep_draw_y + tex_h * scale),
+                    )
+                    char_min = (float(char_draw_x), float(char_draw_y))
+                    char_max = (
+                        float(char_draw_x + ref_preview["width"] * scale),
+                        float(char_draw_y + ref_preview["height"] * scale),
+                    )
+
                     # 盾牌主手特例：先绘制盾牌，再绘制角色，实现盾牌在角色图下方
                     if is_shield_mainhand:
-                        draw_list.add_image(
-                            preview["tex_id"],
-                            (float(wep_draw_x), float(wep_draw_y)),
-                            (
-                                float(wep_draw_x + tex_w * scale),
-                                float(wep_draw_y + tex_h * scale),
-                            ),
-                        )
-                        draw_list.add_image(
-                            ref_preview["tex_id"],
-                            (float(char_draw_x), float(char_draw_y)),
-                            (
-                                float(char_draw_x + ref_preview["width"] * scale),
-                                float(char_draw_y + ref_preview["height"] * scale),
-                            ),
-                        )
+                        draw_list.add_image(preview["tex_id"], wep_min, wep_max)
+                        draw_list.add_image(ref_preview["tex_id"], char_min, char_max)
                     else:
-                        draw_list.add_image(
-                            ref_preview["tex_id"],
-                            (float(char_draw_x), float(char_draw_y)),
-                            (
-                                float(char_draw_x + ref_preview["width"] * scale),
-                                float(char_draw_y + ref_preview["height"] * scale),
-                            ),
-                        )
-                        draw_list.add_image(
-                            preview["tex_id"],
-                            (float(wep_draw_x), float(wep_draw_y)),
-                            (
-                                float(wep_draw_x + tex_w * scale),
-                                float(wep_draw_y + tex_h * scale),
-                            ),
-                        )
+                        draw_list.add_image(ref_preview["tex_id"], char_min, char_max)
+                        draw_list.add_image(preview["tex_id"], wep_min, wep_max)
 
                     draw_list.add_rect(
-                        wep_draw_x,
-                        wep_draw_y,
-                        wep_draw_x + tex_w * scale,
-                        wep_draw_y + tex_h * scale,
-                        imgui.get_color_u32_rgba(0.0, 1.0, 1.0, 0.8),
-                        thickness=2.0,
+                        wep_min[0],
+                        wep_min[1],
+                        wep_max[0],
+                        wep_max[1],
+                        color_u32(0.0, 1.0, 1.0, 0.8),
+                        0.0,
+                        0,
+                        2.0,
                     )
 
                     draw_list.pop_clip_rect()
@@ -5507,10 +5609,10 @@ class ModGeneratorGUI:
         bg_height = box_h * scale
 
         # 计算预览区域与窗口裁剪区域的交集
-        preview_clip_min_x = max(start_pos[0], clip_min_x)
-        preview_clip_min_y = max(start_pos[1], clip_min_y)
-        preview_clip_max_x = min(start_pos[0] + bg_width, clip_max_x)
-        preview_clip_max_y = min(start_pos[1] + bg_height, clip_max_y)
+        preview_clip_min_x = max(start_x, clip_min_x)
+        preview_clip_min_y = max(start_y, clip_min_y)
+        preview_clip_max_x = min(start_x + bg_width, clip_max_x)
+        preview_clip_max_y = min(start_y + bg_height, clip_max_y)
 
         # 只有当裁剪区域有效时才绘制
         if (
@@ -5526,15 +5628,15 @@ class ModGeneratorGUI:
 
             self.draw_checkerboard(
                 draw_list,
-                start_pos,
-                (start_pos[0] + bg_width, start_pos[1] + bg_height),
+                (start_x, start_y),
+                (start_x + bg_width, start_y + bg_height),
                 cell_size=int(8 * scale),
             )
 
             draw_list.add_image(
                 preview["tex_id"],
-                (float(start_pos[0]), float(start_pos[1])),
-                (float(start_pos[0] + width), float(start_pos[1] + height)),
+                (start_x, start_y),
+                (float(start_x + width), float(start_y + height)),
             )
 
             draw_list.pop_clip_rect()
@@ -5542,28 +5644,55 @@ class ModGeneratorGUI:
         imgui.dummy(bg_width, bg_height)
 
     def draw_checkerboard(self, draw_list, p_min, p_max, cell_size=24):
-        """绘制棋盘格背景"""
+        """绘制棋盘格背景
+
+        用一张 2x2 的平铺贴图（GL_REPEAT）一次画完，uv 按格子数缩放。
+        """
         x0, y0 = p_min
         x1, y1 = p_max
+        if cell_size < CHECKERBOARD_MIN_CELL_SIZE:
+            # 格子小于 2px 时已看不出图案，直接填亮暗两色的平均灰
+            draw_list.add_rect_filled(x0, y0, x1, y1, color_u32(0.5, 0.5, 0.5))
+            return
 
-        col_bg = imgui.get_color_u32_rgba(0.4, 0.4, 0.4, 1.0)
-        draw_list.add_rect_filled(x0, y0, x1, y1, col_bg)
+        tile = cell_size * 2
+        draw_list.add_image(
+            self._get_checkerboard_texture(),
+            (x0, y0),
+            (x1, y1),
+            (0.0, 0.0),
+            ((x1 - x0) / tile, (y1 - y0) / tile),
+        )
 
-        col_fg = imgui.get_color_u32_rgba(0.6, 0.6, 0.6, 1.0)
+    def _get_checkerboard_texture(self):
+        """获取棋盘格平铺贴图（左上为亮格）"""
+        if self.checkerboard_tex_id is not None:
+            return self.checkerboard_tex_id
 
-        y = y0
-        row = 0
-        while y < y1:
-            x = x0 + (cell_size if row % 2 != 0 else 0)
-            row_next_y = min(y + cell_size, y1)
+        light = bytes((153, 153, 153, 255))
+        dark = bytes((102, 102, 102, 255))
+        image_data = light + dark + dark + light
 
-            while x < x1:
-                next_x = min(x + cell_size, x1)
-                draw_list.add_rect_filled(x, y, next_x, row_next_y, col_fg)
-                x += cell_size * 2
+        tex_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, tex_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+        glTexImage2D(
+            GL_TEXTURE_2D,
+            0,
+            GL_RGBA,
+            2,
+            2,
+            0,
+            GL_RGBA,
+            GL_UNSIGNED_BYTE,
+            image_data,
+        )
 
-            y = row_next_y
-            row += 1
+        self.checkerboard_tex_id = tex_id
+        return tex_id
 
     def get_texture_preview(self, path):
         """获取贴图预览"""
@@ -5611,6 +5740,9 @@ class ModGeneratorGUI:
         for preview in self.texture_preview_cache.values():
             glDeleteTextures(int(preview["tex_id"]))
         self.texture_preview_cache.clear()
+        if self.checkerboard_tex_id is not None:
+            glDeleteTextures(int(self.checkerboard_tex_id))
+            self.checkerboard_tex_id = None
 
     # ==================== 辅助UI方法 ====================
 
@@ -5619,14 +5751,15 @@ class ModGeneratorGUI:
         current_label = str(labels.get(current_value, current_value))
         new_value = current_value
 
-        if current_value not in options:
-            options = list(options) + [current_value]
-
         if imgui.begin_combo(label, current_label):
             for opt in options:
                 display = labels.get(opt, opt)
                 if imgui.selectable(display, opt == current_value)[0]:
                     new_value = opt
+            # 当前值不在选项中（如旧版本数据）时追加在末尾，只在展开时检查
+            if current_value not in options:
+                if imgui.selectable(current_label, True)[0]:
+                    new_value = current_value
             imgui.end_combo()
 
         if tooltip and imgui.is_item_hovered():
@@ -5648,15 +5781,15 @@ class ModGeneratorGUI:
         Returns:
             选中的 Enum 值
         """
-        if options is None:
-            options = list(enum_class)
-        
-        current_label = labels.get(current_enum, str(current_enum.value))
+        # 未提供标签时才回退到 str(value)，避免每帧为每个选项构造字符串
+        current_label = labels.get(current_enum)
+        if current_label is None:
+            current_label = str(current_enum.value)
         new_value = current_enum
         
         if imgui.begin_combo(label, current_label):
-            for opt in options:
-                display = labels.get(opt, str(opt.value))
+            for opt in (enum_class if options is None else options):
+                display = labels[opt] if opt in labels else str(opt.value)
                 if imgui.selectable(display, opt == current_enum)[0]:
                     new_value = opt
             imgui.end_combo()
@@ -5666,6 +5799,32 @@ class ModGeneratorGUI:
         
         return new_value
 
+    def _forget_item_caches(self, item):
+        """删除物品后移除以该物品为键的缓存条目"""
+        self.validation_cache.pop(id(item), None)
+        self.hybrid_base_heights.pop(id(item), None)
+
+    def _clear_item_caches(self):
+        """新建/打开项目后清空所有以物品为键的缓存"""
+        self.validation_cache.clear()
+        self.hybrid_base_heights.clear()
+
+    def _validate_item_cached(self, item):
+        """校验武器/护甲（含警告），相关状态未变化时复用上次结果"""
+        cached = self.validation_cache.get(id(item))
+        # 条目持有物品引用，id 不会被复用；is 校验防止误取其他物品的结果
+        if cached and cached[0] is item and cached[1] == validate_item_key(item, self.project):
+            return cached[2]
+
+        errors = validate_item(item, self.project, include_warnings=True)
+        # validate_item 会规范化 item.name，键需在校验之后计算
+        self.validation_cache[id(item)] = (
+            item,
+            validate_item_key(item, self.project),
+            errors,
+        )
+        return errors
+
     def _draw_validation_errors(self, errors):
         """显示验证错误 - 增强视觉对比"""
         if not errors:
@@ -5674,87 +5833,70 @@ class ModGeneratorGUI:
         imgui.text("消息:")
 
         for error in errors:
-            if error.endswith("):"):
+            kind, text = parse_validation_message(error)
+            if kind is None:
                 # 物品标题行，跳过
                 continue
-            content = error.lstrip()
 
             # 区分警告和错误，使用图标增强辨识度
-            if content.startswith("• WARNING:"):
+            imgui.text("  ")
+            imgui.same_line()
+            if kind == "warning":
                 # 警告：黄色 + 警告图标
-                imgui.text("  ")
-                imgui.same_line()
                 self.text_warning("!")
                 imgui.same_line()
-                self.text_warning(content[10:].strip())  # 去掉 "• WARNING:" 前缀
-            elif content.startswith("•"):
-                # 错误：红色 + 错误图标
-                imgui.text("  ")
-                imgui.same_line()
-                self.text_error("X")
-                imgui.same_line()
-                self.text_error(content[1:].strip())  # 去掉 "•" 前缀
+                self.text_warning(text)
             else:
-                # 其他错误
-                imgui.text("  ")
-                imgui.same_line()
+                # 错误：红色 + 错误图标
                 self.text_error("X")
                 imgui.same_line()
-                self.text_error(error)
+                self.text_error(text)
 
     def draw_indented_separator(self):
         """绘制缩进分隔线"""
-        style = imgui.get_style()
-        spacing = style.item_spacing.y
-        imgui.dummy(0, spacing * 0.3)
+        gap = self.separator_gap
+        imgui.dummy(0, gap)
         cursor_x, cursor_y = imgui.get_cursor_screen_pos()
         max_x = cursor_x + imgui.get_content_region_available_width()
-        color = style.colors[imgui.COLOR_SEPARATOR]
-        draw_list = imgui.get_window_draw_list()
-        draw_list.add_line(
-            cursor_x, cursor_y, max_x, cursor_y, imgui.get_color_u32_rgba(*color)
+        imgui.get_window_draw_list().add_line(
+            cursor_x, cursor_y, max_x, cursor_y, self.separator_color
         )
-        imgui.dummy(0, spacing * 0.3)
+        imgui.dummy(0, gap)
 
     # ==================== 文件对话框 ====================
 
-    def file_dialog(self, file_types=None, multiple=False):
-        """文件对话框"""
-        root = None
-        try:
+    def _get_tk_root(self):
+        """获取隐藏的 Tk 根窗口（首次使用时创建，之后所有对话框复用）"""
+        if self._tk_root is None:
             root = tk.Tk()
             root.withdraw()
             root.attributes("-topmost", True)
+            self._tk_root = root
+        return self._tk_root
 
+    def file_dialog(self, file_types=None, multiple=False):
+        """文件对话框"""
+        try:
+            root = self._get_tk_root()
             ftypes = file_types if file_types else [("All files", "*.*")]
 
             if multiple:
-                file_paths = filedialog.askopenfilenames(filetypes=ftypes)
+                file_paths = filedialog.askopenfilenames(parent=root, filetypes=ftypes)
                 return list(file_paths) if file_paths else []
             else:
-                file_path = filedialog.askopenfilename(filetypes=ftypes)
+                file_path = filedialog.askopenfilename(parent=root, filetypes=ftypes)
                 return file_path
         except Exception as e:
             print(f"文件对话框错误: {e}")
             return [] if multiple else ""
-        finally:
-            if root:
-                root.destroy()
 
     def select_directory_dialog(self):
         """选择目录对话框"""
-        root = None
         try:
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes("-topmost", True)
-            return filedialog.askdirectory()
+            return filedialog.askdirectory(parent=self._get_tk_root())
         except Exception as e:
             print(f"目录选择错误: {e}")
             return ""
-        finally:
-            if root:
-                root.destroy()
 
     # ==================== 项目操作 ====================
 
@@ -5766,6 +5908,7 @@ class ModGeneratorGUI:
             assets_dir = os.path.join(directory, "assets")
 
             self.project = ModProject()
+            self._clear_item_caches()
             self.project.file_path = project_file
             self.current_weapon_index = -1
             self.current_armor_index = -1
@@ -5782,13 +5925,15 @@ class ModGeneratorGUI:
         directory = self.select_directory_dialog()
         if directory:
             file_path = os.path.join(directory, "project.json")
-            if os.path.exists(file_path):
-                if self.project.load(file_path):
-                    self.current_weapon_index = -1
-                else:
-                    self._show_error("无法加载项目文件，文件可能已损坏")
-            else:
+            loaded = self.project.load(file_path)
+            self._clear_item_caches()  # 物品列表已被替换，旧缓存作废
+            if loaded:
+                self.current_weapon_index = -1
+            # 只在加载失败时才检查文件是否存在，用于区分提示
+            elif not os.path.exists(file_path):
                 self._show_error(f"在 {directory} 中未找到 project.json")
+            else:
+                self._show_error("无法加载项目文件，文件可能已损坏")
 
     def save_project_dialog(self):
         """保存项目"""
@@ -5919,17 +6064,14 @@ class ModGeneratorGUI:
             print("复制贴图文件...")
             texture_errors = []
             for item in self.project.weapons + self.project.armors:
-                # 判断是否为多姿势护甲
-                is_multi_pose = (
-                    isinstance(item, Armor) and item.needs_multi_pose_textures()
-                )
                 errs = copy_item_textures(
                     item_id=item.id,
                     textures=item.textures,
                     sprites_dir=sprites_dir,
                     copy_char=item.needs_char_texture(),
                     copy_left=item.needs_left_texture(),
-                    is_multi_pose_armor=is_multi_pose,
+                    # 仅头/身/手/腿/背护甲为多姿势
+                    is_multi_pose_armor=item.needs_multi_pose_textures(),
                 )
                 texture_errors.extend(errs)
 
@@ -18,7 +18,12 @@ from constants import (
     ARMOR_SLOT_TO_HOOK,
     ARMOR_SLOTS_MULTI_POSE,
     ARMOR_SLOTS_WITH_CHAR_PREVIEW,
+    DAMAGE_ATTRIBUTES,
+    GAME_FPS,
+    HYBRID_QUALITY_LABELS,
     HYBRID_SLOT_LABELS,
+    HYBRID_TWO_HAND_WEAPON_TYPES,
+    HYBRID_WEIGHT_TO_ARMOR_CLASS,
     ITEM_TYPE_CONFIG,
     LEFT_HAND_SLOTS,
     PRIMARY_LANGUAGE,
@@ -87,8 +92,25 @@ class ChargeMode(Enum):
 
 
 def get_relative_path(path: str, project_dir: str) -> str:
-    """将绝对路径转换为相对于项目目录的路径"""
-    return os.path.relpath(path, project_dir) if path else ""
+    """将绝对路径转换为相对于项目目录的路径
+
+    项目目录内的路径直接截掉目录前缀，其余情况才交给 os.path.relpath。
+    两边先 normpath（消除重复/末尾分隔符和 ..），前缀以分隔符结尾，
+    因此 /a/b 不会误匹配 /a/bc/x；比较经过 normcase（不改变长度），
+    Windows 下大小写不影响命中。
+    """
+    if not path:
+        return ""
+    if project_dir:
+        norm_path = os.path.normpath(path)
+        prefix = os.path.join(os.path.normpath(project_dir), "")
+        if os.path.normcase(norm_path).startswith(os.path.normcase(prefix)):
+            return norm_path[len(prefix):]
+    try:
+        return os.path.relpath(path, project_dir)
+    except ValueError:
+        # Windows 下跨盘符无法求相对路径，保留原路径
+        return path
 
 
 def resolve_path(path: str, project_dir: str) -> str:
@@ -96,10 +118,42 @@ def resolve_path(path: str, project_dir: str) -> str:
     return os.path.normpath(os.path.join(project_dir, path)) if path else ""
 
 
+# 贴图路径字段表（保存时转为相对路径，加载时转回绝对路径）
+TEXTURE_PATH_LIST_FIELDS = ("character", "character_left", "inventory", "loot")
+TEXTURE_PATH_FIELDS = (
+    "character_standing1",
+    "character_rest",
+    "character_female",
+    "character_standing1_female",
+    "character_rest_female",
+)
+
+
+def _map_texture_paths(get_value, convert, keep_empty: bool = True) -> dict:
+    """按字段表转换所有贴图路径，只返回路径字段组成的字典
+
+    get_value(name) 读取原始值：保存时读 ItemTextures 属性，加载时读 JSON 字典。
+    转换在读取时一并完成，不需要先复制整份贴图数据再回头改写。
+    保存和加载共用同一份字段表，只是 convert 不同；新增路径字段只需修改字段表。
+    keep_empty 为 False 时丢弃列表中的空路径。
+    """
+    result = {}
+    for name in TEXTURE_PATH_LIST_FIELDS:
+        val = get_value(name)
+        if isinstance(val, list):
+            result[name] = list(map(convert, val if keep_empty else filter(None, val)))
+        else:
+            result[name] = []
+    for name in TEXTURE_PATH_FIELDS:
+        val = get_value(name)
+        result[name] = convert(val) if val else ""
+    return result
+
+
 # ============== 本地化数据 ==============
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ItemLocalization:
     """物品本地化数据，格式: {"Chinese": {"name": "...", "description": "..."}, ...}"""
 
@@ -131,7 +185,7 @@ class ItemLocalization:
 # ============== 贴图数据 ==============
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ItemTextures:
     """物品贴图数据（武器/护甲通用）
 
@@ -264,6 +318,13 @@ class ItemTextures:
         """是否有女性版休息姿势贴图"""
         return bool(self.character_rest_female)
 
+    def clear_standing1(self):
+        """清理站立姿势1贴图（女性版站立姿势1依赖它，一并清理）"""
+        self.character_standing1 = ""
+        self.offset_x_standing1 = 0
+        self.offset_y_standing1 = 0
+        self.clear_female_standing1()
+
     def clear_female_standing0(self):
         """清理女性版站立姿势0贴图"""
         self.character_female = ""
@@ -290,16 +351,21 @@ class ItemTextures:
         """是否有战利品贴图"""
         return len(self.loot) > 0
 
+    def loot_preview_fps(self) -> float:
+        """战利品动画的实际预览帧率（相对帧率按游戏帧率换算）"""
+        if self.loot_use_relative_speed:
+            return GAME_FPS * self.loot_fps
+        return self.loot_fps
+
     def is_animated(self, field_name: str) -> bool:
         """指定字段是否为动画"""
-        data = getattr(self, field_name, [])
-        return len(data) > 1
+        return len(getattr(self, field_name, ())) > 1
 
 
 # ============== 物品基类 ==============
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Item:
     """物品基类 - 武器和护甲的公共数据字段"""
 
@@ -349,11 +415,15 @@ class Item:
         """判断是否需要左手贴图（子类重写）"""
         return False
 
+    def needs_multi_pose_textures(self) -> bool:
+        """判断是否需要多姿势穿戴贴图（子类重写，仅护甲可能为 True）"""
+        return False
+
 
 # ============== 护甲类 ==============
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Armor(Item):
     """护甲/装备数据类"""
 
@@ -394,7 +464,7 @@ class Armor(Item):
 # ============== 武器类 ==============
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Weapon(Item):
     """武器数据类"""
 
@@ -423,7 +493,7 @@ QUALITY_UNIQUE = 6
 QUALITY_ARTIFACT = 7
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class HybridItem:
     """混合物品数据类 - 灵活的模块化物品类型
     
@@ -514,7 +584,7 @@ class HybridItem:
     
     # ====== 分类元数据（用于 drop/shop 随机选取）======
     cat: str = ""  # 主分类（单选）
-    subcats: List[str] = field(default_factory=list)  # 子分类（多选）
+    subcats: List[str] = field(default_factory=list)  # 子分类（多选，保持有序）
     
     # ====== Tags 设置 ======
     exclude_from_random: bool = True  # True 时添加 "special" 标签排除随机生成
@@ -562,17 +632,15 @@ class HybridItem:
     def needs_char_texture(self) -> bool:
         """判断是否需要角色/穿戴贴图"""
         # 手持槽位或可装备的身体槽位需要角色贴图
-        if self.slot == "hand" and self.equipable:
-            return True
-        if self.slot in ["Head", "Chest", "Arms", "Legs", "Back"] and self.equipable:
-            return True
-        return False
+        if not self.equipable:
+            return False
+        return self.slot == "hand" or self.slot in ARMOR_SLOTS_MULTI_POSE
     
     def needs_left_texture(self) -> bool:
         """判断是否需要左手贴图"""
-        if self.slot == "hand" and self.equipable and self.hands == 1:
-            # 单手武器需要左手贴图
-            return self.weapon_type in ["sword", "axe", "mace", "dagger"]
+        # 单手武器需要左手贴图；LEFT_HAND_SLOTS 均为单手武器，无需再经 hands 计算
+        if self.slot == "hand" and self.equipable:
+            return self.weapon_type in LEFT_HAND_SLOTS
         return False
     
     def needs_multi_pose_textures(self) -> bool:
@@ -582,21 +650,28 @@ class HybridItem:
 
     def get_quality_label(self) -> str:
         """获取品质显示文本"""
-        from constants import HYBRID_QUALITY_LABELS
         return HYBRID_QUALITY_LABELS.get(self.quality, "普通")
     
+    def sync_quality_fields(self):
+        """同步由品质决定的字段：文物固定 treasure 分类，独特带 unique 品质标签
+
+        仅在品质改变或加载时调用，界面每帧不再重复写入。
+        """
+        if self.quality == QUALITY_ARTIFACT:
+            self.cat = "treasure"
+        else:
+            if self.cat == "treasure":
+                self.cat = ""
+            if "treasure" in self.subcats:
+                self.subcats.remove("treasure")
+        self.quality_tag = "unique" if self.quality == QUALITY_UNIQUE else ""
+    
     def get_loot_parent(self) -> str:
         """获取 Loot 对象的父类"""
         # if self.is_weapon:
         #     return "o_weapon_loot"
         return "o_consument_loot"
     
-    # ====== 双手武器类型 ======
-    TWO_HAND_WEAPONS = {"2hsword", "2haxe", "2hmace", "2hStaff", "bow", "crossbow", "spear"}
-    
-    # ====== Weight 到 ArmorClass 的映射 ======
-    WEIGHT_TO_ARMOR_CLASS = {"Light": "Light", "Medium": "Medium", "Heavy": "Heavy", "VeryLight": "Light"}
-    
     # ====== 装备相关计算属性 ======
     @property
     def equipable(self) -> bool:
@@ -611,7 +686,7 @@ class HybridItem:
         - 护甲模式: 始终返回 1（包括盾牌，因为盾牌是 armor 模式的单手装备）
         - 其他模式: 返回 1
         """
-        if self.equipment_mode == EquipmentMode.WEAPON and self.weapon_type in self.TWO_HAND_WEAPONS:
+        if self.equipment_mode == EquipmentMode.WEAPON and self.weapon_type in HYBRID_TWO_HAND_WEAPON_TYPES:
             return 2
         return 1
     
@@ -627,7 +702,7 @@ class HybridItem:
     @property
     def armor_class(self) -> str:
         """护甲类别（Light/Medium/Heavy）- 由 weight 决定"""
-        return self.WEIGHT_TO_ARMOR_CLASS.get(self.weight, "Light")
+        return HYBRID_WEIGHT_TO_ARMOR_CLASS.get(self.weight, "Light")
     
     # ====== 装备形态计算属性 ======
     @property
@@ -663,17 +738,25 @@ class HybridItem:
         else:  # LIMITED
             return self.charge
     
-    def _build_tags_list(self, prefix: list = None) -> list:  # <- extracted helper
-        """构建 tags 列表（内部方法）"""
-        parts = list(prefix) if prefix else []
-        if self.quality_tag:
-            parts.append(self.quality_tag)
-        if self.dungeon_tag:
-            parts.append(self.dungeon_tag)
-        if self.country_tag:
-            parts.append(self.country_tag)
-        parts.extend(self.extra_tags)
-        return parts
+    def has_custom_tags(self) -> bool:
+        """是否设置了品质/地牢/国家/其他 tag（全空时可跳过 tags 拼接）"""
+        return bool(
+            self.quality_tag or self.dungeon_tag or self.country_tag or self.extra_tags
+        )
+
+    def _build_tags(self) -> tuple:
+        """构建 tags 元组（内部方法）
+
+        顺序：special 前缀（排除随机生成时）、品质/地牢/国家 tag、其他 tags
+        """
+        prefix = ("special",) if self.exclude_from_random else ()
+        if not self.has_custom_tags():
+            return prefix
+        return (
+            *prefix,
+            *filter(None, (self.quality_tag, self.dungeon_tag, self.country_tag)),
+            *self.extra_tags,
+        )
 
     @property
     def effective_tags(self) -> str:
@@ -681,8 +764,7 @@ class HybridItem:
         
         排除随机生成时：在现有标签前添加 'special' 前缀
         """
-        prefix = ["special"] if self.exclude_from_random else []
-        return " ".join(self._build_tags_list(prefix))
+        return " ".join(self._build_tags())
     
     @property
     def tags_tuple(self) -> tuple:
@@ -690,8 +772,7 @@ class HybridItem:
         
         排除随机生成时：包含 'special' 前缀
         """
-        prefix = ["special"] if self.exclude_from_random else []
-        return tuple(self._build_tags_list(prefix))
+        return self._build_tags()
     
     @property
     def has_equipment_spawn(self) -> bool:
@@ -763,7 +844,7 @@ def validate_item(
         errors.append(f"槽位为 '{slot_name}' 的{type_name}必须提供左手贴图")
 
     # 多姿势装备贴图检查（头/身/手/腿/背需要休息姿势贴图）
-    if isinstance(item, Armor) and item.needs_multi_pose_textures():
+    if item.needs_multi_pose_textures():
         if not item.textures.has_rest():
             errors.append(f"槽位为 '{slot_name}' 的装备必须提供休息姿势贴图")
 
@@ -785,6 +866,28 @@ def validate_item(
     return formatted
 
 
+def validate_item_key(item: Item, project=None) -> tuple:
+    """validate_item 结果所依赖的全部状态
+
+    键相同则校验结果相同，供界面跳过无变化时的逐帧重复校验。
+    """
+    textures = item.textures
+    key = (
+        type(item),
+        item.name,
+        item.slot,
+        bool(textures.character),
+        bool(textures.character_left),
+        bool(textures.character_rest),
+        bool(textures.loot),
+        bool(textures.inventory),
+    )
+    if project:
+        item_list = project.weapons if isinstance(item, Weapon) else project.armors
+        key += tuple(i.name for i in item_list)
+    return key
+
+
 def validate_hybrid_item(
     item: HybridItem, project=None, include_warnings: bool = False
 ) -> List[str]:
@@ -828,7 +931,6 @@ def validate_hybrid_item(
         if item.slot != "hand":
             errors.append("WARNING: 武器类型物品的槽位通常应为 'hand'")
         # 检查 attributes 中是否有伤害值
-        from constants import DAMAGE_ATTRIBUTES
         has_damage = any(item.attributes.get(attr, 0) > 0 for attr in DAMAGE_ATTRIBUTES)
         if not has_damage:
             errors.append("武器应在属性中设置至少一种伤害类型")
@@ -1040,22 +1142,18 @@ class ModProject:
 
     def _serialize_textures(self, textures: ItemTextures, project_dir: str) -> dict:
         """序列化贴图数据"""
+        paths = _map_texture_paths(
+            lambda name: getattr(textures, name),
+            lambda p: get_relative_path(p, project_dir),
+        )
         return {
-            "character": [
-                get_relative_path(p, project_dir) for p in textures.character
-            ],
+            "character": paths["character"],
             # 多姿势装备专用字段
-            "character_standing1": get_relative_path(
-                textures.character_standing1, project_dir
-            ),
-            "character_rest": get_relative_path(textures.character_rest, project_dir),
-            "character_left": [
-                get_relative_path(p, project_dir) for p in textures.character_left
-            ],
-            "inventory": [
-                get_relative_path(p, project_dir) for p in textures.inventory
-            ],
-            "loot": [get_relative_path(p, project_dir) for p in textures.loot],
+            "character_standing1": paths["character_standing1"],
+            "character_rest": paths["character_rest"],
+            "character_left": paths["character_left"],
+            "inventory": paths["inventory"],
+            "loot": paths["loot"],
             # 偏移设置
             "offset_x": textures.offset_x,
             "offset_y": textures.offset_y,
@@ -1067,19 +1165,13 @@ class ModProject:
             "offset_x_rest": textures.offset_x_rest,
             "offset_y_rest": textures.offset_y_rest,
             # 女性版贴图（多姿势装备专用）
-            "character_female": get_relative_path(
-                textures.character_female, project_dir
-            ),
+            "character_female": paths["character_female"],
             "offset_x_female": textures.offset_x_female,
             "offset_y_female": textures.offset_y_female,
-            "character_standing1_female": get_relative_path(
-                textures.character_standing1_female, project_dir
-            ),
+            "character_standing1_female": paths["character_standing1_female"],
             "offset_x_standing1_female": textures.offset_x_standing1_female,
             "offset_y_standing1_female": textures.offset_y_standing1_female,
-            "character_rest_female": get_relative_path(
-                textures.character_rest_female, project_dir
-            ),
+            "character_rest_female": paths["character_rest_female"],
             "offset_x_rest_female": textures.offset_x_rest_female,
             "offset_y_rest_female": textures.offset_y_rest_female,
             # 动画设置
@@ -1091,26 +1183,17 @@ class ModProject:
         self, tex_data: dict, project_dir: str
     ) -> ItemTextures:
         """反序列化贴图数据"""
-
-        def to_path_list(val):
-            """将列表中的相对路径转换为绝对路径"""
-            if isinstance(val, list):
-                return [resolve_path(p, project_dir) for p in val if p]
-            return []
-
-        def to_path(val):
-            """将相对路径转换为绝对路径"""
-            if val:
-                return resolve_path(val, project_dir)
-            return ""
+        paths = _map_texture_paths(
+            tex_data.get, lambda p: resolve_path(p, project_dir), keep_empty=False
+        )
 
         return ItemTextures(
-            character=to_path_list(tex_data.get("character", [])),
-            character_standing1=to_path(tex_data.get("character_standing1", "")),
-            character_rest=to_path(tex_data.get("character_rest", "")),
-            character_left=to_path_list(tex_data.get("character_left", [])),
-            inventory=to_path_list(tex_data.get("inventory", [])),
-            loot=to_path_list(tex_data.get("loot", [])),
+            character=paths["character"],
+            character_standing1=paths["character_standing1"],
+            character_rest=paths["character_rest"],
+            character_left=paths["character_left"],
+            inventory=paths["inventory"],
+            loot=paths["loot"],
             # 偏移设置
             offset_x=tex_data.get("offset_x", 0),
             offset_y=tex_data.get("offset_y", 0),
@@ -1122,13 +1205,13 @@ class ModProject:
             offset_x_rest=tex_data.get("offset_x_rest", 0),
             offset_y_rest=tex_data.get("offset_y_rest", 0),
             # 女性版贴图
-            character_female=to_path(tex_data.get("character_female", "")),
+            character_female=paths["character_female"],
             offset_x_female=tex_data.get("offset_x_female", 0),
             offset_y_female=tex_data.get("offset_y_female", 0),
-            character_standing1_female=to_path(tex_data.get("character_standing1_female", "")),
+            character_standing1_female=paths["character_standing1_female"],
             offset_x_standing1_female=tex_data.get("offset_x_standing1_female", 0),
             offset_y_standing1_female=tex_data.get("offset_y_standing1_female", 0),
-            character_rest_female=to_path(tex_data.get("character_rest_female", "")),
+            character_rest_female=paths["character_rest_female"],
             offset_x_rest_female=tex_data.get("offset_x_rest_female", 0),
             offset_y_rest_female=tex_data.get("offset_y_rest_female", 0),
             # 动画设置
@@ -1210,7 +1293,7 @@ class ModProject:
             drop_sound=item_data.get("drop_sound", 911),
             pickup_sound=item_data.get("pickup_sound", 907),
             cat=item_data.get("cat", ""),
-            subcats=item_data.get("subcats", []),
+            subcats=sorted(item_data.get("subcats", [])),  # 界面按有序列表显示/插入
             exclude_from_random=item_data.get("exclude_from_random", True),
             quality_tag=item_data.get("quality_tag", ""),
             dungeon_tag=item_data.get("dungeon_tag", ""),
@@ -1225,6 +1308,7 @@ class ModProject:
             shop_spawn=SpawnRule(item_data.get("shop_spawn", "none")),
         )
         
+        item.sync_quality_fields()  # 旧数据可能与品质不一致
         item.localization = ItemLocalization(
             languages=item_data.get("localization", {})
         )
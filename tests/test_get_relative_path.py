@@ -0,0 +1,45 @@
+"""get_relative_path 快速路径须与 os.path.relpath 结果一致"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import get_relative_path  # noqa: E402
+
+PROJECT_DIR = os.path.join(os.sep, "a", "b")
+
+
+@pytest.mark.parametrize(
+    "path, project_dir",
+    [
+        # 项目目录内
+        (os.path.join(PROJECT_DIR, "x.png"), PROJECT_DIR),
+        (os.path.join(PROJECT_DIR, "sub", "x.png"), PROJECT_DIR),
+        # 项目目录带末尾分隔符
+        (os.path.join(PROJECT_DIR, "x.png"), PROJECT_DIR + os.sep),
+        # 重复分隔符 / 末尾分隔符
+        (PROJECT_DIR + os.sep + os.sep + "x.png", PROJECT_DIR),
+        (os.path.join(PROJECT_DIR, "sub") + os.sep, PROJECT_DIR),
+        # 同名前缀的兄弟目录：/a/b 不能匹配 /a/bc/x
+        (os.path.join(os.sep, "a", "bc", "x.png"), PROJECT_DIR),
+        # 含 .. 的路径
+        (os.path.join(PROJECT_DIR, "sub", "..", "x.png"), PROJECT_DIR),
+        (os.path.join(PROJECT_DIR, "..", "c", "x.png"), PROJECT_DIR),
+        # 项目目录本身及其上级目录
+        (PROJECT_DIR, PROJECT_DIR),
+        (os.path.join(os.sep, "a", "x.png"), PROJECT_DIR),
+        # 根目录作为项目目录
+        (os.path.join(os.sep, "x.png"), os.sep),
+        # 相对路径
+        (os.path.join("b", "x.png"), "b"),
+    ],
+)
+def test_matches_relpath(path, project_dir):
+    assert get_relative_path(path, project_dir) == os.path.relpath(path, project_dir)
+
+
+def test_empty_path():
+    assert get_relative_path("", PROJECT_DIR) == ""